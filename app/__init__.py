@@ -1,11 +1,21 @@
 import os
-import uuid
-from flask import Flask, jsonify, g, request
+from flask import Flask, jsonify, g
+from werkzeug.middleware.proxy_fix import ProxyFix
 from app.errors.handlers import APIError
 from app.core.logging import configure_logging
+from app.core.compression import init_compression
+from app.core.correlation import init_correlation
+from app.core.query_stats import init_query_stats
+from app.core.revocation import init_revocation
+from app.core.jobs import jobs_cli
+from app.core.duplicate_loads import init_duplicate_load_detection
 from app.core.config import config_map
 from app.routes.v1.example import example_bp
 from app.routes.health import health_bp
+from app.routes.query_stats import query_stats_bp
+from app.modules.example.commands import example_cli
+from app.utils.rate_limit import add_role_claim
+from app.modules.example import tasks  # noqa: F401  registers the module's jobs
 from .extensions import db, migrate, jwt, cors, limiter, talisman
 
 env = os.getenv("FLASK_ENV", "development")
@@ -15,24 +25,31 @@ def create_app():
     app = Flask(__name__)
     app.config.from_object(config_map[env])
 
+    if app.config["RATELIMIT_TRUSTED_PROXIES"]:
+        # Rate-limit keys fall back to remote_addr; take it from X-Forwarded-For
+        # only as far back as the proxies we actually run.
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=app.config["RATELIMIT_TRUSTED_PROXIES"])
+
     configure_logging()
 
     @app.before_request
-    def set_correlation_id():
-        g.correlation_id = request.headers.get("X-Correlation-ID", str(uuid.uuid4()))
-
-    @app.after_request
-    def add_correlation_header(response):
-        response.headers["X-Correlation-ID"] = getattr(g, "correlation_id", "")
-        return response
+    def reset_request_state():
+        # g lives as long as the app context, which spans several requests
+        # when one is already pushed (the test suite does this).
+        g.pop("actor", None)
 
     @app.errorhandler(APIError)
     def handle_api_error(error):
         return jsonify(error.to_json()), error.status_code
 
     db.init_app(app)
+    init_correlation(app)
+    init_query_stats(app)
+    init_duplicate_load_detection(app)
     migrate.init_app(app, db)
     jwt.init_app(app)
+    jwt.additional_claims_loader(add_role_claim)
+    init_revocation(app)
     cors.init_app(app, origins=app.config["CORS_ORIGINS"], supports_credentials=app.config["CORS_SUPPORTS_CREDENTIALS"])
     limiter.init_app(app)
 
@@ -44,7 +61,13 @@ def create_app():
             content_security_policy=app.config["TALISMAN_CONTENT_SECURITY_POLICY"],
         )
 
+    init_compression(app)
+
     app.register_blueprint(health_bp)
     app.register_blueprint(example_bp)
+    app.register_blueprint(query_stats_bp)
+
+    app.cli.add_command(example_cli)
+    app.cli.add_command(jobs_cli)
 
     return app
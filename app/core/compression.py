@@ -0,0 +1,170 @@
+"""Response compression.
+
+Negotiates a Content-Encoding from Accept-Encoding in an after_request hook.
+gzip and deflate always work (stdlib zlib); brotli and zstd are offered only
+when the optional ``brotli`` / ``zstandard`` packages are installed.
+
+Bodies under COMPRESSION_MIN_SIZE are sent as-is, streamed responses are
+compressed chunk by chunk, and buffered responses can be cached compressed,
+keyed by ETag, so a hot response is compressed once per encoding.
+"""
+import threading
+import zlib
+from collections import OrderedDict
+
+from flask import request
+
+try:
+    import brotli
+except ImportError:  # optional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional
+    zstandard = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "text/",
+    "image/svg+xml",
+)
+
+
+class _BrotliCompressor:
+    """Adapts brotli.Compressor to the zlib compressobj interface."""
+
+    def __init__(self, level):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data):
+        return self._compressor.process(data)
+
+    def flush(self):
+        return self._compressor.finish()
+
+
+def _available_encoders():
+    # Server preference order; best_match breaks client q-value ties with it.
+    encoders = OrderedDict()
+    if zstandard is not None:
+        encoders["zstd"] = lambda level: zstandard.ZstdCompressor(level=level).compressobj()
+    if brotli is not None:
+        encoders["br"] = _BrotliCompressor
+    encoders["gzip"] = lambda level: zlib.compressobj(level, zlib.DEFLATED, 31)
+    encoders["deflate"] = lambda level: zlib.compressobj(level, zlib.DEFLATED, 15)
+    return encoders
+
+
+ENCODERS = _available_encoders()
+
+
+def compress(data, encoding, level):
+    compressor = ENCODERS[encoding](level)
+    return compressor.compress(data) + compressor.flush()
+
+
+class CompressionCache:
+    """Thread-safe LRU of compressed bodies, bounded by total bytes."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+            return body
+
+    def put(self, key, body):
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self._entries[key] = body
+            self.size += len(body)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+
+def _is_compressible(response):
+    if response.status_code < 200 or response.status_code in (204, 206, 304):
+        return False
+    if response.direct_passthrough or "Content-Encoding" in response.headers:
+        return False
+    return (response.mimetype or "").startswith(COMPRESSIBLE_TYPES)
+
+
+def _stream(chunks, compressor, close):
+    try:
+        for chunk in chunks:
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.flush()
+    finally:
+        if close is not None:
+            close()
+
+
+def compress_response(response, config, cache=None):
+    response.vary.add("Accept-Encoding")
+    if not _is_compressible(response):
+        return response
+
+    encoding = request.accept_encodings.best_match(ENCODERS)
+    if encoding is None:
+        return response
+    level = config["COMPRESSION_LEVELS"][encoding]
+
+    if response.is_streamed:
+        original = response.response
+        response.response = _stream(response.iter_encoded(), ENCODERS[encoding](level), getattr(original, "close", None))
+        response.headers.pop("Content-Length", None)
+        response.headers["Content-Encoding"] = encoding
+        return response
+
+    if response.calculate_content_length() < config["COMPRESSION_MIN_SIZE"]:
+        return response
+
+    body = None
+    etag, weak = response.get_etag()
+    if cache is not None:
+        if etag is None:
+            response.add_etag()
+            etag, weak = response.get_etag()
+        key = (etag, encoding, level)
+        body = cache.get(key)
+    if body is None:
+        body = compress(response.get_data(), encoding, level)
+        if cache is not None:
+            cache.put(key, body)
+
+    response.set_data(body)
+    response.headers["Content-Encoding"] = encoding
+    if etag is not None:
+        # A strong ETag must change with the representation.
+        response.set_etag(f"{etag}-{encoding}", weak)
+    return response
+
+
+def init_compression(app):
+    if not app.config["COMPRESSION_ENABLED"]:
+        return
+    max_bytes = app.config["COMPRESSION_CACHE_MAX_BYTES"]
+    cache = CompressionCache(max_bytes) if max_bytes else None
+    app.extensions["compression_cache"] = cache
+
+    @app.after_request
+    def compress_after_request(response):
+        return compress_response(response, app.config, cache)
@@ -12,16 +12,99 @@ class BaseConfig:
     # Override via env var: DEFAULT_TIMEZONE=Asia/Manila
     DEFAULT_TIMEZONE = os.getenv("DEFAULT_TIMEZONE", "Asia/Manila")
 
+    # Listing counts: unfiltered totals are cached per worker for this many
+    # seconds, and on PostgreSQL tables above the threshold use the planner's
+    # row estimate instead of a full COUNT(*).
+    COUNT_CACHE_TTL = int(os.getenv("COUNT_CACHE_TTL", "30"))
+    APPROXIMATE_COUNT_THRESHOLD = int(os.getenv("APPROXIMATE_COUNT_THRESHOLD", "100000"))
+
+    # Response compression (app/core/compression.py). Levels trade CPU for
+    # bytes; brotli/zstd are only used when their packages are installed.
+    COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+    COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "500"))
+    COMPRESSION_LEVELS = {
+        "zstd": int(os.getenv("COMPRESSION_ZSTD_LEVEL", "3")),
+        "br": int(os.getenv("COMPRESSION_BROTLI_LEVEL", "4")),
+        "gzip": int(os.getenv("COMPRESSION_GZIP_LEVEL", "6")),
+        "deflate": int(os.getenv("COMPRESSION_GZIP_LEVEL", "6")),
+    }
+    COMPRESSION_CACHE_MAX_BYTES = int(os.getenv("COMPRESSION_CACHE_MAX_BYTES", str(8 * 1024 * 1024)))
+
+    # Deletes: set-based, in chunks of BULK_DELETE_CHUNK_SIZE ids (below
+    # SQLite's 999 bound-parameter limit). With SOFT_DELETE_USERS, deletes
+    # only stamp deleted_at and `flask example purge-deleted` removes rows
+    # older than SOFT_DELETE_RETENTION_DAYS. BULK_DELETE_MAX_IDS is also the
+    # filter-delete row cap and the bulk-delete rate limit per minute (before
+    # the role multiplier).
+    BULK_DELETE_CHUNK_SIZE = 500
+    BULK_DELETE_MAX_IDS = 10000
+    SOFT_DELETE_USERS = os.getenv("SOFT_DELETE_USERS", "false").lower() == "true"
+    SOFT_DELETE_RETENTION_DAYS = int(os.getenv("SOFT_DELETE_RETENTION_DAYS", "30"))
+
+    # Streaming export/import batch sizes (rows per fetch / per INSERT).
+    EXPORT_BATCH_SIZE = 1000
+    IMPORT_BATCH_SIZE = 500
+
+    # Background jobs (app/core/jobs.py, `flask jobs worker`).
+    JOB_WORKER_CONCURRENCY = int(os.getenv("JOB_WORKER_CONCURRENCY", "2"))
+    JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "1.0"))
+    JOB_MAX_ATTEMPTS = 3
+    JOB_RETRY_BACKOFF = 10
+    # Running jobs refresh their lock every JOB_HEARTBEAT_INTERVAL seconds;
+    # one without a heartbeat for JOB_LOCK_TIMEOUT seconds has lost its worker.
+    JOB_HEARTBEAT_INTERVAL = 30
+    JOB_LOCK_TIMEOUT = 600
+
     JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", SECRET_KEY)
     JWT_ACCESS_TOKEN_EXPIRES = 900
     JWT_REFRESH_TOKEN_EXPIRES = 2592000
     JWT_TOKEN_LOCATION = ["headers", "cookies"]
     JWT_COOKIE_SECURE = True
     JWT_COOKIE_CSRF_PROTECT = True
+    # Verified-token cache (app/core/tokens.py); 0 disables it. Entries never
+    # outlive the token's exp, nor JWT_DECODE_CACHE_MAX_TTL seconds.
+    JWT_DECODE_CACHE_SIZE = int(os.getenv("JWT_DECODE_CACHE_SIZE", "4096"))
+    JWT_DECODE_CACHE_MAX_TTL = JWT_ACCESS_TOKEN_EXPIRES
+    # Token revocation (app/core/revocation.py). Other workers see a new
+    # revocation within JWT_REVOCATION_SYNC_INTERVAL seconds. Each sync
+    # re-reads the last JWT_REVOCATION_SYNC_MARGIN seconds of revocations, to
+    # cover late commits and clock skew between app servers.
+    JWT_REVOCATION_SYNC_INTERVAL = int(os.getenv("JWT_REVOCATION_SYNC_INTERVAL", "5"))
+    JWT_REVOCATION_SYNC_MARGIN = int(os.getenv("JWT_REVOCATION_SYNC_MARGIN", "60"))
+    JWT_REVOCATION_PRUNE_INTERVAL = int(os.getenv("JWT_REVOCATION_PRUNE_INTERVAL", "3600"))
+    JWT_REVOCATION_BUCKET_SECONDS = 3600
+    JWT_REVOCATION_BLOOM_CAPACITY = 10000
+    JWT_REVOCATION_BLOOM_ERROR_RATE = 0.001
 
     CORS_ORIGINS = os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
     CORS_SUPPORTS_CREDENTIALS = True
 
+    # Rate limiting (app/utils/rate_limit.py). Use a shared store such as
+    # redis:// in production so all workers see the same counters; the
+    # fixed-window strategy costs one atomic increment per request.
+    RATELIMIT_STORAGE_URI = os.getenv("RATELIMIT_STORAGE_URI", "memory://")
+    RATELIMIT_STRATEGY = "fixed-window"
+    RATELIMIT_TRUSTED_PROXIES = int(os.getenv("RATELIMIT_TRUSTED_PROXIES", "0"))
+    RATELIMIT_ROLE_CACHE_TTL = 60
+
+    # Request correlation ids (app/core/correlation.py). Longer inbound ids
+    # are truncated. SQL comments are opt-in: they make each statement's text
+    # unique, which defeats driver statement caches keyed on SQL text
+    # (sqlite3, asyncpg) and server-side plan caches.
+    CORRELATION_ID_MAX_LENGTH = 64
+    CORRELATION_ID_SQL_COMMENTS = os.getenv("CORRELATION_ID_SQL_COMMENTS", "false").lower() == "true"
+
+    # Per-fingerprint SQL timings (app/core/query_stats.py, GET /query-stats).
+    # Statements taking QUERY_SLOW_THRESHOLD_MS or longer are logged.
+    QUERY_STATS_ENABLED = os.getenv("QUERY_STATS_ENABLED", "true").lower() == "true"
+    QUERY_STATS_MAX_FINGERPRINTS = 500
+    QUERY_STATS_SAMPLE_SIZE = 200
+    QUERY_SLOW_THRESHOLD_MS = float(os.getenv("QUERY_SLOW_THRESHOLD_MS", "200"))
+
+    # Flag ORM rows loaded twice in one request (app/core/duplicate_loads.py):
+    # None, "log" or "raise".
+    DUPLICATE_LOAD_DETECTION = None
+
     TALISMAN_FORCE_HTTPS = True
     TALISMAN_STRICT_TRANSPORT_SECURITY = True
     TALISMAN_CONTENT_SECURITY_POLICY = {
@@ -33,6 +116,7 @@ class BaseConfig:
 
 class DevelopmentConfig(BaseConfig):
     DEBUG = True
+    DUPLICATE_LOAD_DETECTION = "log"
     JWT_COOKIE_SECURE = False
     JWT_COOKIE_CSRF_PROTECT = False
     TALISMAN_FORCE_HTTPS = False
@@ -49,10 +133,12 @@ class ProductionConfig(BaseConfig):
 
 class TestingConfig(BaseConfig):
     TESTING = True
+    DUPLICATE_LOAD_DETECTION = "raise"
     JWT_COOKIE_CSRF_PROTECT = False
     JWT_COOKIE_SECURE = False
     TALISMAN_FORCE_HTTPS = False
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    COUNT_CACHE_TTL = 0
 
 
 config_map = {
@@ -0,0 +1,95 @@
+"""Request correlation ids.
+
+Every request gets ``g.correlation_id``: the caller's X-Correlation-ID when
+it is a short token of safe characters, otherwise a freshly generated id. It
+is echoed in the response, added to every JSON log line (app/core/logging.py)
+and, with CORRELATION_ID_SQL_COMMENTS, appended to each SQL statement as
+``/*correlation_id='...'*/`` so database-side slow query logs can be joined
+back to the request.
+
+Generated ids are ULID-shaped: 26 Crockford base32 characters made of a
+48-bit millisecond timestamp, a random 40-bit per-process prefix and a 40-bit
+counter. They sort by creation time and need no os.urandom call per id (uuid4
+makes one). The prefix is redrawn after fork, so preloaded gunicorn workers
+never share a prefix and counter.
+"""
+import itertools
+import os
+import re
+import time
+
+from flask import g, request
+from sqlalchemy import event
+
+from app.extensions import db
+
+HEADER = "X-Correlation-ID"
+
+_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+# Two base32 characters per 10 bits: half the lookups of a per-character loop.
+_PAIRS = [a + b for a in _ALPHABET for b in _ALPHABET]
+_INBOUND = re.compile(r"[A-Za-z0-9._:-]+")
+
+
+def _b32(value, length):
+    """Encode ``value`` as ``length`` (even) base32 characters, most significant first."""
+    return "".join([_PAIRS[(value >> shift) & 1023] for shift in range(5 * (length - 2), -1, -10)])
+
+
+class CorrelationIdGenerator:
+    def __init__(self):
+        self.reseed()
+
+    def reseed(self):
+        self._prefix = _b32(int.from_bytes(os.urandom(5), "big"), 8)
+        self._counter = itertools.count()
+        self._clock = (0, _b32(0, 10))
+
+    def __call__(self):
+        ms = time.time_ns() // 1_000_000
+        last_ms, encoded = self._clock
+        # Re-encode the timestamp once per millisecond. A clock stepped back
+        # keeps the last timestamp so ids from this process stay ordered.
+        if ms > last_ms:
+            encoded = _b32(ms, 10)
+            self._clock = (ms, encoded)
+        n = next(self._counter)
+        return (
+            encoded + self._prefix
+            + _PAIRS[(n >> 30) & 1023] + _PAIRS[(n >> 20) & 1023] + _PAIRS[(n >> 10) & 1023] + _PAIRS[n & 1023]
+        )
+
+
+generate_correlation_id = CorrelationIdGenerator()
+os.register_at_fork(after_in_child=generate_correlation_id.reseed)
+
+
+def correlation_id_from(value, max_length):
+    """Return ``value`` truncated to ``max_length``, or a new id if it is empty or has unsafe characters."""
+    value = (value or "")[:max_length]
+    return value if _INBOUND.fullmatch(value) else generate_correlation_id()
+
+
+def _comment_statement(conn, cursor, statement, parameters, context, executemany):
+    # Inbound ids are restricted to [A-Za-z0-9._:-], so they can't close the comment.
+    correlation_id = g.get("correlation_id") if g else None
+    if correlation_id:
+        statement = f"{statement} /*correlation_id='{correlation_id}'*/"
+    return statement, parameters
+
+
+def init_correlation(app):
+    @app.before_request
+    def set_correlation_id():
+        g.correlation_id = correlation_id_from(request.headers.get(HEADER), app.config["CORRELATION_ID_MAX_LENGTH"])
+
+    @app.after_request
+    def add_correlation_header(response):
+        response.headers[HEADER] = g.get("correlation_id", "")
+        return response
+
+    if app.config["CORRELATION_ID_SQL_COMMENTS"]:
+        with app.app_context():
+            for engine in db.engines.values():
+                if not event.contains(engine, "before_cursor_execute", _comment_statement):
+                    event.listen(engine, "before_cursor_execute", _comment_statement, retval=True)
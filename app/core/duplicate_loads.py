@@ -0,0 +1,54 @@
+"""Duplicate primary-key load detection.
+
+Counts every ORM instance loaded or refreshed from the database during a
+request, keyed by (model, primary key). Loading the same row twice in one
+request means an N+1 or a repeated lookup that should go through the
+session's identity map or current_actor() instead.
+
+DUPLICATE_LOAD_DETECTION = "log" warns once per duplicate; "raise" raises
+DuplicateLoadError at the second load so the test suite fails on it.
+"""
+import logging
+from collections import Counter
+
+from flask import current_app, g
+from sqlalchemy import event
+
+from app.extensions import db
+
+logger = logging.getLogger(__name__)
+
+
+class DuplicateLoadError(AssertionError):
+    pass
+
+
+def _record_load(target, *_):
+    # Only counted between before_request and teardown; CLI commands, jobs
+    # and test setup code load freely.
+    loads = g.get("_pk_loads") if g else None
+    if loads is None:
+        return
+    key = (type(target).__name__, db.inspect(target).identity)
+    loads[key] += 1
+    if loads[key] == 2:
+        message = f"{key[0]} {key[1]} loaded more than once in this request"
+        if current_app.config["DUPLICATE_LOAD_DETECTION"] == "raise":
+            raise DuplicateLoadError(message)
+        logger.warning(message)
+
+
+def init_duplicate_load_detection(app):
+    if not app.config.get("DUPLICATE_LOAD_DETECTION"):
+        return
+    if not event.contains(db.Model, "load", _record_load):
+        event.listen(db.Model, "load", _record_load, propagate=True)
+        event.listen(db.Model, "refresh", _record_load, propagate=True)
+
+    @app.before_request
+    def start_counting_loads():
+        g._pk_loads = Counter()
+
+    @app.teardown_request
+    def stop_counting_loads(exc):
+        g.pop("_pk_loads", None)
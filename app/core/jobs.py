@@ -0,0 +1,288 @@
+"""Background jobs.
+
+A small DB-backed queue for work that shouldn't run on a request thread.
+Register a function with ``@task("name")``, enqueue it from anywhere with
+``enqueue("name", {...})`` and run ``flask jobs worker`` to process it.
+
+Workers claim jobs with ``SELECT ... FOR UPDATE SKIP LOCKED`` on PostgreSQL.
+Other databases (SQLite) fall back to a compare-and-set UPDATE on the status
+column, which is safe but serializes claims. Failed jobs are retried with
+exponential backoff up to ``max_attempts``. While a job runs, its worker
+refreshes ``locked_at`` every JOB_HEARTBEAT_INTERVAL seconds, so only jobs
+whose worker died go JOB_LOCK_TIMEOUT seconds without a heartbeat. Those
+are requeued, or marked failed once their attempts are used up, so a job
+that keeps killing its worker stops being retried.
+
+``@periodic`` tasks are enqueued once per local day (see ``today_in``); the
+``unique_key`` constraint keeps several workers from enqueueing the same run.
+"""
+import logging
+import os
+import random
+import signal
+import socket
+import threading
+import time
+from datetime import timedelta
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from sqlalchemy.exc import IntegrityError
+
+from app.database.schema import Job
+from app.extensions import db
+from app.utils.timezone import to_local, today_in, utc_now
+
+logger = logging.getLogger(__name__)
+
+TASKS = {}
+PERIODIC = {}
+
+
+def task(name):
+    """Register ``fn`` as the handler for jobs called ``name``; it receives the payload as kwargs."""
+    def decorator(fn):
+        TASKS[name] = fn
+        return fn
+    return decorator
+
+
+def periodic(name, at, tz=None):
+    """Enqueue task ``name`` once a day, at or after local time ``at`` in ``tz`` (default DEFAULT_TIMEZONE)."""
+    def decorator(fn):
+        PERIODIC[name] = (at, tz)
+        return task(name)(fn)
+    return decorator
+
+
+def enqueue(name, payload=None, run_at=None, max_attempts=None, unique_key=None):
+    """Queue a job and return it, or None if ``unique_key`` was already queued.
+
+    The job row is flushed but not committed: the caller's commit makes it
+    visible to workers, together with the caller's own changes. Two callers
+    racing on the same ``unique_key`` make the second flush raise IntegrityError.
+    """
+    if name not in TASKS:
+        raise ValueError(f"Unknown task: {name}")
+    if unique_key is not None and db.session.scalar(db.select(Job.id).filter_by(unique_key=unique_key)) is not None:
+        return None
+    job = Job(
+        name=name,
+        payload=payload or {},
+        run_at=run_at or utc_now(),
+        max_attempts=max_attempts or current_app.config["JOB_MAX_ATTEMPTS"],
+        unique_key=unique_key,
+    )
+    db.session.add(job)
+    db.session.flush()
+    return job
+
+
+class Worker:
+    def __init__(self, app, concurrency=None, worker_id=None):
+        self.app = app
+        self.concurrency = concurrency or app.config["JOB_WORKER_CONCURRENCY"]
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.poll_interval = app.config["JOB_POLL_INTERVAL"]
+        self.stopping = threading.Event()
+        self._scheduled = {}
+        self._next_requeue = 0.0
+
+    def run(self):
+        threads = [
+            threading.Thread(target=self._loop, name=f"job-worker-{i}", daemon=True)
+            for i in range(self.concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        while any(thread.is_alive() for thread in threads):
+            for thread in threads:
+                thread.join(timeout=0.5)
+
+    def stop(self, *_):
+        self.stopping.set()
+
+    def _loop(self):
+        with self.app.app_context():
+            while not self.stopping.is_set():
+                self.schedule_periodic()
+                if not self.run_once():
+                    self.stopping.wait(self.poll_interval)
+
+    def schedule_periodic(self):
+        default_tz = current_app.config["DEFAULT_TIMEZONE"]
+        for name, (at, tz) in PERIODIC.items():
+            tz = tz or default_tz
+            key = f"{name}:{today_in(tz).isoformat()}"
+            if self._scheduled.get(name) == key or to_local(utc_now(), tz).time() < at:
+                continue
+            try:
+                enqueue(name, unique_key=key)
+                db.session.commit()
+            except IntegrityError:
+                db.session.rollback()  # another worker enqueued it first
+            self._scheduled[name] = key
+
+    def run_once(self):
+        """Claim and run one due job. Returns False when the queue had nothing due."""
+        # Stale locks only appear once per heartbeat interval at most, so
+        # don't scan for them on every poll.
+        if time.monotonic() >= self._next_requeue:
+            self._next_requeue = time.monotonic() + self.app.config["JOB_HEARTBEAT_INTERVAL"]
+            self._requeue_stale()
+        job = self.claim()
+        if job is None:
+            return False
+        self.execute(job)
+        return True
+
+    def claim(self):
+        now = utc_now()
+        candidate = (
+            db.select(Job.id)
+            .where(Job.status == "queued", Job.run_at <= now)
+            .order_by(Job.run_at, Job.id)
+            .limit(1)
+        )
+        if db.engine.dialect.name == "postgresql":
+            candidate = candidate.with_for_update(skip_locked=True)
+        job_id = db.session.scalar(candidate)
+        if job_id is None:
+            db.session.commit()
+            return None
+        claimed = db.session.execute(
+            db.update(Job)
+            .where(Job.id == job_id, Job.status == "queued")
+            .values(status="running", locked_by=self.worker_id, locked_at=now, attempts=Job.attempts + 1),
+            execution_options={"synchronize_session": False},
+        ).rowcount
+        db.session.commit()
+        # Lost the compare-and-set race to another worker; try the next job.
+        return db.session.get(Job, job_id) if claimed else self.claim()
+
+    def execute(self, job):
+        started = time.perf_counter()
+        started_at = utc_now()
+        handler = TASKS.get(job.name)
+        beating = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(job.id, beating), daemon=True)
+        heartbeat.start()
+        try:
+            if handler is None:
+                raise LookupError(f"No handler registered for task {job.name}")
+            handler(**job.payload)
+        except Exception as e:
+            db.session.rollback()
+            result = {"last_error": f"{type(e).__name__}: {e}"[:1000]}
+            if handler is None or job.attempts >= job.max_attempts:
+                result["status"] = "failed"
+            else:
+                result["status"] = "queued"
+                result["run_at"] = utc_now() + timedelta(seconds=self._backoff(job.attempts))
+            logger.exception("Job %s (%s) failed on attempt %s", job.id, job.name, job.attempts)
+        else:
+            result = {"status": "done", "last_error": None}
+        finally:
+            beating.set()
+            heartbeat.join()
+        duration_ms = int((time.perf_counter() - started) * 1000)
+        # Only record the outcome while this worker still holds the job; a
+        # stale-lock requeue may have handed it to another worker meanwhile.
+        recorded = db.session.execute(
+            db.update(Job)
+            .where(Job.id == job.id, Job.status == "running", Job.locked_by == self.worker_id)
+            .values(**result, started_at=started_at, duration_ms=duration_ms, finished_at=utc_now(), locked_by=None),
+            execution_options={"synchronize_session": False},
+        ).rowcount
+        db.session.commit()
+        if recorded:
+            logger.info("Job %s (%s) %s in %sms", job.id, job.name, result["status"], duration_ms)
+        else:
+            logger.warning("Job %s (%s) lost its lock after %sms; outcome not recorded", job.id, job.name, duration_ms)
+
+    def _backoff(self, attempts):
+        base = current_app.config["JOB_RETRY_BACKOFF"]
+        return base * 2 ** (attempts - 1) * random.uniform(0.5, 1.5)
+
+    def _heartbeat(self, job_id, done):
+        # Own thread, own app context and therefore own session.
+        interval = self.app.config["JOB_HEARTBEAT_INTERVAL"]
+        with self.app.app_context():
+            while not done.wait(interval):
+                try:
+                    self.touch(job_id)
+                except Exception:
+                    db.session.rollback()
+                    logger.exception("Heartbeat for job %s failed", job_id)
+
+    def touch(self, job_id):
+        """Refresh ``locked_at`` on a job this worker is running. Returns False if it no longer holds it."""
+        touched = db.session.execute(
+            db.update(Job)
+            .where(Job.id == job_id, Job.status == "running", Job.locked_by == self.worker_id)
+            .values(locked_at=utc_now()),
+            execution_options={"synchronize_session": False},
+        ).rowcount
+        db.session.commit()
+        return bool(touched)
+
+    def _requeue_stale(self):
+        now = utc_now()
+        cutoff = now - timedelta(seconds=current_app.config["JOB_LOCK_TIMEOUT"])
+        stale = (Job.status == "running", Job.locked_at < cutoff)
+        db.session.execute(
+            db.update(Job)
+            .where(*stale, Job.attempts >= Job.max_attempts)
+            .values(status="failed", locked_by=None, finished_at=now, last_error="Worker lost: lock expired"),
+            execution_options={"synchronize_session": False},
+        )
+        db.session.execute(
+            db.update(Job)
+            .where(*stale)
+            .values(status="queued", locked_by=None),
+            execution_options={"synchronize_session": False},
+        )
+        db.session.commit()
+
+
+jobs_cli = AppGroup("jobs", help="Background job queue.")
+
+
+@jobs_cli.command("worker")
+@click.option("--concurrency", type=int, default=None, help="Defaults to JOB_WORKER_CONCURRENCY.")
+def run_worker(concurrency):
+    """Process queued jobs until SIGINT/SIGTERM."""
+    worker = Worker(current_app._get_current_object(), concurrency=concurrency)
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+    click.echo(f"Worker {worker.worker_id} running {worker.concurrency} threads, tasks: {', '.join(sorted(TASKS))}")
+    worker.run()
+
+
+@jobs_cli.command("enqueue")
+@click.argument("name")
+def enqueue_job(name):
+    """Queue a job with no payload, e.g. to trigger a periodic task now."""
+    if name not in TASKS:
+        raise click.BadParameter(f"Unknown task {name!r}; expected one of: {', '.join(sorted(TASKS))}", param_hint="NAME")
+    job = enqueue(name)
+    db.session.commit()
+    click.echo(f"Queued job {job.id} ({name})")
+
+
+@jobs_cli.command("stats")
+def job_stats():
+    """Per-task counts and timings."""
+    rows = db.session.execute(
+        db.select(
+            Job.name,
+            Job.status,
+            db.func.count(),
+            db.func.avg(Job.duration_ms),
+            db.func.max(Job.duration_ms),
+        ).group_by(Job.name, Job.status).order_by(Job.name, Job.status)
+    ).all()
+    click.echo(f"{'task':<32} {'status':<8} {'count':>7} {'avg ms':>9} {'max ms':>9}")
+    for name, status, count, avg_ms, max_ms in rows:
+        click.echo(f"{name:<32} {status:<8} {count:>7} {avg_ms or 0:>9.1f} {max_ms or 0:>9}")
@@ -0,0 +1,129 @@
+"""Per-statement query statistics.
+
+Engine events time every statement and fold it into a fingerprint: the SQL
+with comments, literals and placeholders normalized, and IN lists of any
+length collapsed. Each fingerprint keeps count, total, max and a sample of
+recent durations for p95. The table is bounded by QUERY_STATS_MAX_FINGERPRINTS
+and evicts the least recently seen fingerprint first.
+
+Statements slower than QUERY_SLOW_THRESHOLD_MS are logged as warnings, so
+the JSON log line carries the request's correlation id. Stats are per
+process: each gunicorn worker reports its own (see ``GET /query-stats``).
+"""
+import logging
+import math
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from functools import lru_cache
+
+from sqlalchemy import event
+
+from app.extensions import db
+
+logger = logging.getLogger(__name__)
+
+SORT_KEYS = ("total_ms", "count", "mean_ms", "max_ms", "p95_ms")
+
+_COMMENT = re.compile(r"/\*.*?\*/|--[^\n]*", re.S)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<![:\w]):\w+|__\[POSTCOMPILE_\w+\]|\b\d+(?:\.\d+)?\b")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement):
+    """Normalize ``statement`` so executions differing only in values share one key."""
+    sql = _COMMENT.sub(" ", statement)
+    sql = _STRING.sub("?", sql)
+    sql = _PLACEHOLDER.sub("?", sql)
+    sql = _VALUE_LIST.sub("(...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+class _Entry:
+    __slots__ = ("count", "total", "max", "samples")
+
+    def __init__(self, sample_size):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples = deque(maxlen=sample_size)
+
+
+class QueryStats:
+    def __init__(self, max_fingerprints=500, sample_size=200, slow_threshold_ms=None):
+        self.max_fingerprints = max_fingerprints
+        self.sample_size = sample_size
+        self.slow_threshold_ms = slow_threshold_ms
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(self, statement, seconds):
+        key = fingerprint(statement)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry(self.sample_size)
+                if len(self._entries) > self.max_fingerprints:
+                    self._entries.popitem(last=False)
+            else:
+                self._entries.move_to_end(key)
+            entry.count += 1
+            entry.total += seconds
+            entry.max = max(entry.max, seconds)
+            entry.samples.append(seconds)
+        if self.slow_threshold_ms is not None and seconds * 1000 >= self.slow_threshold_ms:
+            logger.warning("Slow query (%.1fms): %s", seconds * 1000, key)
+
+    def top(self, limit=20, sort="total_ms"):
+        """Return up to ``limit`` fingerprints as dicts, highest ``sort`` (one of SORT_KEYS) first."""
+        with self._lock:
+            snapshot = [(key, e.count, e.total, e.max, sorted(e.samples)) for key, e in self._entries.items()]
+        report = [
+            {
+                "fingerprint": key,
+                "count": count,
+                "total_ms": round(total * 1000, 3),
+                "mean_ms": round(total / count * 1000, 3),
+                "max_ms": round(longest * 1000, 3),
+                "p95_ms": round(samples[math.ceil(0.95 * len(samples)) - 1] * 1000, 3),
+            }
+            for key, count, total, longest, samples in snapshot
+        ]
+        report.sort(key=lambda row: row[sort], reverse=True)
+        return report[:limit]
+
+    def reset(self):
+        with self._lock:
+            self._entries.clear()
+
+
+query_stats = QueryStats()
+
+
+def _start_timer(conn, cursor, statement, parameters, context, executemany):
+    context._query_started = time.perf_counter()
+
+
+def _record_query(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_query_started", None)
+    if started is not None:
+        # context.statement is the compiled SQL, before other listeners
+        # append comments (e.g. the correlation id).
+        query_stats.record(context.statement or statement, time.perf_counter() - started)
+
+
+def init_query_stats(app):
+    if not app.config["QUERY_STATS_ENABLED"]:
+        return
+    query_stats.max_fingerprints = app.config["QUERY_STATS_MAX_FINGERPRINTS"]
+    query_stats.sample_size = app.config["QUERY_STATS_SAMPLE_SIZE"]
+    query_stats.slow_threshold_ms = app.config["QUERY_SLOW_THRESHOLD_MS"]
+    with app.app_context():
+        for engine in db.engines.values():
+            if not event.contains(engine, "before_cursor_execute", _start_timer):
+                event.listen(engine, "before_cursor_execute", _start_timer)
+                event.listen(engine, "after_cursor_execute", _record_query)
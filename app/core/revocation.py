@@ -0,0 +1,176 @@
+"""Token revocation.
+
+Revoked JTIs live in the ``revoked_tokens`` table. Each worker mirrors the
+table into Bloom filters bucketed by token expiry, so the per-request check
+is a single in-memory probe of the bucket for the token's ``exp``. Only a
+Bloom hit goes to the database to rule out a false positive.
+
+Workers sync at most every JWT_REVOCATION_SYNC_INTERVAL seconds. Each sync
+re-reads every row with ``revoked_at`` no older than the previous sync
+minus JWT_REVOCATION_SYNC_MARGIN seconds; adding a JTI twice is harmless.
+Syncing on ids instead would skip a row whose transaction took a lower id
+but committed after a higher one had been read.
+
+Guarantee: a revocation takes effect on every worker within the sync
+interval, provided its transaction commits within the margin of the
+``revoked_at`` it stamps, and app server clocks agree to within the margin.
+Buckets are dropped once every token they cover has expired, and expired
+rows are deleted from the table every JWT_REVOCATION_PRUNE_INTERVAL seconds.
+"""
+import hashlib
+import math
+import threading
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from flask import current_app
+
+from app.database.schema import RevokedToken
+from app.extensions import db, jwt
+from app.utils.timezone import to_utc
+
+NO_EXPIRY = math.inf
+
+
+class BloomFilter:
+    def __init__(self, capacity, error_rate):
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item):
+        # Kirsch-Mitzenmacher double hashing: two 64-bit halves of one digest.
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, item):
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class RevocationIndex:
+    """Bloom filters keyed by expiry bucket; whole buckets expire together."""
+
+    def __init__(self, bucket_seconds, capacity, error_rate):
+        self.bucket_seconds = bucket_seconds
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._buckets = {}
+
+    def _bucket(self, exp):
+        if exp == NO_EXPIRY:
+            return NO_EXPIRY
+        return (int(exp) // self.bucket_seconds + 1) * self.bucket_seconds
+
+    def add(self, jti, exp):
+        bucket = self._bucket(exp)
+        bloom = self._buckets.get(bucket)
+        if bloom is None:
+            bloom = self._buckets[bucket] = BloomFilter(self.capacity, self.error_rate)
+        bloom.add(jti)
+
+    def might_contain(self, jti, exp):
+        bloom = self._buckets.get(self._bucket(exp))
+        return bloom is not None and jti in bloom
+
+    def prune(self, now):
+        for bucket in [b for b in self._buckets if b <= now]:
+            del self._buckets[bucket]
+
+    def __len__(self):
+        return len(self._buckets)
+
+
+class RevocationStore:
+    def __init__(self, config, clock=time.time):
+        self.index = RevocationIndex(
+            config["JWT_REVOCATION_BUCKET_SECONDS"],
+            config["JWT_REVOCATION_BLOOM_CAPACITY"],
+            config["JWT_REVOCATION_BLOOM_ERROR_RATE"],
+        )
+        self.sync_interval = config["JWT_REVOCATION_SYNC_INTERVAL"]
+        self.sync_margin = config["JWT_REVOCATION_SYNC_MARGIN"]
+        self.prune_interval = config["JWT_REVOCATION_PRUNE_INTERVAL"]
+        self.clock = clock
+        self._synced_at = -math.inf
+        # Clock time of the last sync; None until the first (full) load.
+        self._synced_from = None
+        self._pruned_at = clock()
+        self._lock = threading.Lock()
+
+    def revoke(self, jwt_payload):
+        exp = jwt_payload.get("exp")
+        token = RevokedToken(
+            jti=jwt_payload["jti"],
+            token_type=jwt_payload.get("type", "access"),
+            expires_at=_from_epoch(exp) if exp is not None else None,
+        )
+        db.session.add(token)
+        db.session.commit()
+        with self._lock:
+            self.index.add(token.jti, exp if exp is not None else NO_EXPIRY)
+        return token
+
+    def is_revoked(self, jwt_payload):
+        self._maybe_sync()
+        jti = jwt_payload["jti"]
+        if not self.index.might_contain(jti, jwt_payload.get("exp", NO_EXPIRY)):
+            return False
+        return db.session.scalar(db.select(RevokedToken.id).where(RevokedToken.jti == jti)) is not None
+
+    def _maybe_sync(self):
+        now = self.clock()
+        if now - self._synced_at < self.sync_interval:
+            return
+        # One thread syncs; the others keep answering from the current index.
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            self._sync(now)
+            if now - self._pruned_at >= self.prune_interval:
+                self._prune(now)
+        finally:
+            self._lock.release()
+
+    def _sync(self, now):
+        stmt = db.select(RevokedToken.jti, RevokedToken.expires_at)
+        if self._synced_from is not None:
+            stmt = stmt.where(RevokedToken.revoked_at >= _from_epoch(self._synced_from - self.sync_margin))
+        for row in db.session.execute(stmt):
+            self.index.add(row.jti, _to_epoch(row.expires_at) if row.expires_at else NO_EXPIRY)
+        self.index.prune(now)
+        self._synced_from = now
+        self._synced_at = now
+
+    def _prune(self, now):
+        db.session.execute(db.delete(RevokedToken).where(RevokedToken.expires_at <= _from_epoch(now)))
+        db.session.commit()
+        self._pruned_at = now
+
+
+def _to_epoch(dt):
+    return to_utc(dt, "UTC").timestamp()
+
+
+def _from_epoch(seconds):
+    return datetime.fromtimestamp(seconds, tz=ZoneInfo("UTC"))
+
+
+def revoke_token(jwt_payload):
+    """Revoke the token described by ``jwt_payload`` (e.g. ``get_jwt()``)."""
+    return current_app.extensions["token_revocation"].revoke(jwt_payload)
+
+
+def init_revocation(app):
+    app.extensions["token_revocation"] = RevocationStore(app.config)
+
+
+@jwt.token_in_blocklist_loader
+def _token_in_blocklist(jwt_header, jwt_payload):
+    return current_app.extensions["token_revocation"].is_revoked(jwt_payload)
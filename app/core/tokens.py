@@ -0,0 +1,89 @@
+"""Verified-token cache for flask_jwt_extended.
+
+Clients reuse one access token for its whole lifetime, so verifying the
+signature and decoding the claims on every request repeats the same work.
+CachingJWTManager remembers the claims of tokens it has already verified,
+keyed by a SHA-256 digest of the token, until the token's ``exp``.
+
+Only decoding is cached. Blocklist, user lookup and claims verification
+callbacks still run on every request, so revocation is honored.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app
+from flask_jwt_extended import JWTManager
+
+
+class TokenCache:
+    """Bounded LRU of token digest -> claims that drops entries at their ``exp``."""
+
+    def __init__(self, maxsize, max_ttl, clock=time.time):
+        self.maxsize = maxsize
+        self.max_ttl = max_ttl
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(encoded_token, csrf_value=None):
+        # The CSRF value is part of the key so a cookie token with the wrong
+        # double-submit value misses and goes through the full check.
+        material = encoded_token if csrf_value is None else f"{encoded_token}\0{csrf_value}"
+        return hashlib.sha256(material.encode()).digest()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            claims, expires_at = entry
+            if self.clock() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return claims
+
+    def put(self, key, claims):
+        now = self.clock()
+        expires_at = now + self.max_ttl
+        if "exp" in claims:
+            expires_at = min(expires_at, claims["exp"])
+        if expires_at <= now:
+            return
+        with self._lock:
+            self._entries[key] = (claims, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class CachingJWTManager(JWTManager):
+    def init_app(self, app, add_context_processor=False):
+        super().init_app(app, add_context_processor)
+        maxsize = app.config.get("JWT_DECODE_CACHE_SIZE", 0)
+        app.extensions["jwt_decode_cache"] = (
+            TokenCache(maxsize, app.config.get("JWT_DECODE_CACHE_MAX_TTL", 900)) if maxsize else None
+        )
+
+    def _decode_jwt_from_config(self, encoded_token, csrf_value=None, allow_expired=False):
+        cache = current_app.extensions.get("jwt_decode_cache")
+        if cache is None or allow_expired:
+            return super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+
+        key = cache.key(encoded_token, csrf_value)
+        claims = cache.get(key)
+        if claims is None:
+            claims = super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+            cache.put(key, claims)
+        # Callers may stash or mutate the dict; never hand out the cached one.
+        return dict(claims)
@@ -6,6 +6,8 @@ role_permissions = db.Table(
     "role_permissions",
     db.Column("role_id", db.Integer, db.ForeignKey("roles.id"), primary_key=True),
     db.Column("permission_id", db.Integer, db.ForeignKey("permissions.id"), primary_key=True),
+    # The PK already covers role_id lookups; this covers the reverse join from a permission.
+    db.Index("ix_role_permissions_permission_id", "permission_id", "role_id"),
 )
 
 
@@ -15,7 +17,9 @@ class Role(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(50), nullable=False, unique=True)
     description = db.Column(db.String(255), nullable=True)
-    permissions = db.relationship("Permission", secondary=role_permissions, lazy="joined")
+    # Scales every tiered() route limit for members of this role.
+    rate_limit_multiplier = db.Column(db.Float, nullable=False, default=1.0, server_default="1.0")
+    permissions = db.relationship("Permission", secondary=role_permissions, lazy="selectin")
 
 
 class Permission(db.Model):
@@ -32,9 +36,45 @@ class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     email = db.Column(db.String(120), nullable=False, unique=True)
     name = db.Column(db.String(120), nullable=False)
-    age = db.Column(db.Integer, nullable=True)
+    age = db.Column(db.Integer, nullable=True, index=True)
     password_hash = db.Column(db.String(255), nullable=True)
-    role_id = db.Column(db.Integer, db.ForeignKey("roles.id"), nullable=True)
+    role_id = db.Column(db.Integer, db.ForeignKey("roles.id"), nullable=True, index=True)
     role = db.relationship("Role", lazy="joined")
     timezone = db.Column(db.String(64), nullable=False, default="Asia/Manila")
+    created_at = db.Column(db.DateTime(timezone=True), default=utc_now, index=True)
+    # Only set when SOFT_DELETE_USERS is on; hard-deleted later by `flask example purge-deleted`.
+    deleted_at = db.Column(db.DateTime(timezone=True), nullable=True, index=True)
+
+
+class RevokedToken(db.Model):
+    __tablename__ = "revoked_tokens"
+    # AUTOINCREMENT keeps SQLite from reusing the id of a pruned row.
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    id = db.Column(db.Integer, primary_key=True)
+    jti = db.Column(db.String(36), nullable=False, unique=True)
+    token_type = db.Column(db.String(10), nullable=False)
+    expires_at = db.Column(db.DateTime(timezone=True), nullable=True, index=True)
+    # Workers sync on a trailing revoked_at window (app/core/revocation.py).
+    revoked_at = db.Column(db.DateTime(timezone=True), default=utc_now, index=True)
+
+
+class Job(db.Model):
+    __tablename__ = "jobs"
+    __table_args__ = (db.Index("ix_jobs_status_run_at", "status", "run_at"),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+    payload = db.Column(db.JSON, nullable=False, default=dict)
+    status = db.Column(db.String(10), nullable=False, default="queued")
+    unique_key = db.Column(db.String(200), nullable=True, unique=True)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    max_attempts = db.Column(db.Integer, nullable=False, default=3)
+    run_at = db.Column(db.DateTime(timezone=True), nullable=False, default=utc_now)
+    locked_by = db.Column(db.String(100), nullable=True)
+    locked_at = db.Column(db.DateTime(timezone=True), nullable=True)
+    last_error = db.Column(db.String(1000), nullable=True)
     created_at = db.Column(db.DateTime(timezone=True), default=utc_now)
+    started_at = db.Column(db.DateTime(timezone=True), nullable=True)
+    finished_at = db.Column(db.DateTime(timezone=True), nullable=True)
+    duration_ms = db.Column(db.Integer, nullable=True)
@@ -1,18 +1,17 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
-from flask_jwt_extended import JWTManager
 from flask_cors import CORS
 from flask_limiter import Limiter
-from flask_limiter.util import get_remote_address
 from flask_talisman import Talisman
+from app.core.tokens import CachingJWTManager
+from app.utils.rate_limit import rate_limit_key
 
 db = SQLAlchemy()
 migrate = Migrate()
-jwt = JWTManager()
+jwt = CachingJWTManager()
 cors = CORS()
 limiter = Limiter(
-    key_func=get_remote_address,
+    key_func=rate_limit_key,
     default_limits=["200 per day", "50 per hour"],
-    storage_uri="memory://"
 )
 talisman = Talisman()
\ No newline at end of file
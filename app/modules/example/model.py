@@ -1,4 +1,6 @@
-from marshmallow import Schema, fields, validate
+from flask import current_app
+from marshmallow import Schema, ValidationError, fields, validate, validates, validates_schema
+from app.utils.timezone import parse_iso_local
 
 
 class ExampleCreate(Schema):
@@ -12,3 +14,56 @@ class ExampleRead(Schema):
     name = fields.Str(required=True)
     email = fields.Email(required=True)
     age = fields.Int(required=True)
+
+
+class ExampleBulkDelete(Schema):
+    ids = fields.List(fields.Int(strict=True), validate=validate.Length(min=1))
+    filter = fields.Dict(keys=fields.Str(), validate=validate.Length(min=1))
+    max_rows = fields.Int(strict=True, validate=validate.Range(min=1))
+
+    @validates("filter")
+    def validate_filter_types(self, value, **kwargs):
+        # JSON values are type-checked before parse_filters converts them:
+        # int(29.9), int(True) and str(None) would otherwise all match rows.
+        errors = {}
+        for key, raw in value.items():
+            field = EXAMPLE_FILTER_FIELDS.get(key.partition("__")[0])
+            if field is None:
+                continue  # unknown names are reported by parse_filters
+            try:
+                field.deserialize(raw)
+            except ValidationError as e:
+                errors[key] = e.messages
+        if errors:
+            raise ValidationError(errors, "filter")
+
+    @validates_schema
+    def validate_target(self, data, **kwargs):
+        if ("ids" in data) == ("filter" in data):
+            raise ValidationError("Provide exactly one of 'ids' or 'filter'.")
+        if len(data.get("ids", ())) > current_app.config["BULK_DELETE_MAX_IDS"]:
+            raise ValidationError(f"At most {current_app.config['BULK_DELETE_MAX_IDS']} ids per request.", "ids")
+        if "max_rows" in data and "filter" not in data:
+            raise ValidationError("Only allowed with 'filter'.", "max_rows")
+        if data.get("max_rows", 0) > current_app.config["BULK_DELETE_MAX_IDS"]:
+            raise ValidationError(f"At most {current_app.config['BULK_DELETE_MAX_IDS']} rows per request.", "max_rows")
+
+
+def _local_datetime(value):
+    return parse_iso_local(value, current_app.config["DEFAULT_TIMEZONE"])
+
+
+# Listing query whitelist: every column here is indexed (see schema.py), so
+# no combination of filters or sort keys can force a full table scan.
+EXAMPLE_FILTERS = {
+    "age": ({"eq", "lt", "lte", "gt", "gte"}, int),
+    "email": ({"eq", "prefix"}, str),
+    "created_at": ({"lt", "lte", "gt", "gte"}, _local_datetime),
+}
+EXAMPLE_SORTS = ("id", "age", "email", "created_at")
+# Strict JSON types for the same filters when they arrive in a request body.
+EXAMPLE_FILTER_FIELDS = {
+    "age": fields.Int(strict=True),
+    "email": fields.Str(),
+    "created_at": fields.Str(),
+}
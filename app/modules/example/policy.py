@@ -0,0 +1,15 @@
+from app.errors.handlers import ForbiddenError
+from app.utils.policy import BasePolicy
+
+
+class ExamplePolicy(BasePolicy):
+    """Resource-level rules for deleting users, on top of the route's permission check."""
+
+    def delete(self, user_id, actor=None):
+        return self.bulk_delete(ids=[user_id], actor=actor)
+
+    def bulk_delete(self, ids=None, actor=None):
+        actor = self.authorize(actor, "example.delete")
+        if ids is not None and actor.id in ids:
+            raise ForbiddenError("You cannot delete your own account.")
+        return actor
@@ -1,13 +1,46 @@
+from flask import current_app
+from sqlalchemy import text
 from app.extensions import db
 from app.database.schema import User
+from app.modules.example.model import ExampleRead
+from app.utils.query import apply_filters, apply_sort, cached_count, effective_filters
+from app.utils.read_model import read_model
+from app.utils.timezone import utc_now
+
+READ_FIELDS = tuple(ExampleRead().fields)
 
 
 class ExampleRepository:
-    def get_all(self):
-        return db.session.execute(db.select(User)).unique().scalars().all()
+    def get_all(self, fields=None, filters=(), sort=()):
+        """Return slotted ``UserRow`` read models, not tracked by the session."""
+        fields = tuple(fields or READ_FIELDS)
+        stmt = apply_sort(apply_filters(self._live(db.select(*self._columns(fields))), User, filters), User, sort)
+        return read_model("UserRow", fields).from_rows(db.session.execute(stmt))
+
+    def get_by_id(self, user_id, fields=None):
+        fields = tuple(fields or READ_FIELDS)
+        row = db.session.execute(self._live(db.select(*self._columns(fields))).where(User.id == user_id)).first()
+        return read_model("UserRow", fields)(*row) if row else None
+
+    def count(self, filters=()):
+        """Return ``(total, estimated)`` for the listing."""
+        if filters:
+            stmt = apply_filters(self._live(db.select(db.func.count()).select_from(User)), User, filters)
+            return db.session.scalar(stmt), False
+        return cached_count(User.__tablename__, current_app.config["COUNT_CACHE_TTL"], self._count_all)
+
+    def iter_rows(self, fields, batch_size):
+        """Stream live users as plain rows; ``yield_per`` keeps a server-side cursor where the driver has one."""
+        stmt = self._live(db.select(*self._columns(fields))).order_by(User.id)
+        return db.session.execute(stmt.execution_options(yield_per=batch_size))
 
-    def get_by_id(self, user_id):
-        return db.session.get(User, user_id)
+    def existing_emails(self, emails):
+        return set(db.session.scalars(db.select(User.email).where(User.email.in_(emails))))
+
+    def insert_many(self, records):
+        # Core executemany: one round trip per batch, no ORM instances.
+        db.session.execute(db.insert(User), records)
+        db.session.commit()
 
     def create(self, name, email, age):
         user = User(name=name, email=email, age=age)
@@ -16,8 +49,70 @@ class ExampleRepository:
         return user
 
     def delete(self, user_id):
-        user = self.get_by_id(user_id)
-        if user:
-            db.session.delete(user)
+        return self.delete_many([user_id])
+
+    def delete_many(self, user_ids):
+        """Delete (or soft-delete) users by id without loading them. Returns the row count."""
+        chunk_size = current_app.config["BULK_DELETE_CHUNK_SIZE"]
+        ids = sorted(set(user_ids))
+        deleted = 0
+        for start in range(0, len(ids), chunk_size):
+            deleted += self._delete_where(User.id.in_(ids[start:start + chunk_size]))
+        return deleted
+
+    def delete_matching(self, filters, max_rows=None):
+        """Delete (or soft-delete) users matching ``filters``, at most ``max_rows``, one chunk per transaction."""
+        if not effective_filters(filters):
+            raise ValueError("delete_matching needs at least one filter condition")
+        chunk_size = current_app.config["BULK_DELETE_CHUNK_SIZE"]
+        deleted = 0
+        while max_rows is None or deleted < max_rows:
+            size = chunk_size if max_rows is None else min(chunk_size, max_rows - deleted)
+            chunk = apply_filters(self._live(db.select(User.id)), User, filters).limit(size)
+            count = self._delete_where(User.id.in_(chunk.scalar_subquery()))
+            deleted += count
+            if count < size:
+                break
+        return deleted
+
+    def purge_deleted(self, before):
+        """Hard-delete users soft-deleted before ``before``, in chunks. Returns the row count."""
+        chunk_size = current_app.config["BULK_DELETE_CHUNK_SIZE"]
+        purged = 0
+        while True:
+            chunk = db.select(User.id).where(User.deleted_at <= before).limit(chunk_size)
+            result = db.session.execute(db.delete(User).where(User.id.in_(chunk.scalar_subquery())))
             db.session.commit()
-        return user
+            purged += result.rowcount
+            if result.rowcount < chunk_size:
+                return purged
+
+    def _delete_where(self, condition):
+        if current_app.config["SOFT_DELETE_USERS"]:
+            stmt = db.update(User).where(condition, User.deleted_at.is_(None)).values(deleted_at=utc_now())
+        else:
+            stmt = db.delete(User).where(condition)
+        # Set-based statement: nothing to sync into the session's identity map.
+        result = db.session.execute(stmt, execution_options={"synchronize_session": False})
+        db.session.commit()
+        return result.rowcount
+
+    @staticmethod
+    def _live(stmt):
+        return stmt.where(User.deleted_at.is_(None))
+
+    @staticmethod
+    def _columns(fields):
+        # Plain column rows: no ORM instances, no role join, no password_hash.
+        return [getattr(User, name) for name in fields]
+
+    @classmethod
+    def _count_all(cls):
+        if db.engine.dialect.name == "postgresql":
+            estimate = db.session.scalar(
+                text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table"),
+                {"table": User.__tablename__},
+            )
+            if estimate is not None and estimate >= current_app.config["APPROXIMATE_COUNT_THRESHOLD"]:
+                return estimate, True
+        return db.session.scalar(cls._live(db.select(db.func.count()).select_from(User))), False
@@ -1,16 +1,26 @@
+from datetime import timedelta
+from marshmallow import EXCLUDE, ValidationError as MarshmallowValidationError
 from app.modules.example.repository import ExampleRepository
+from app.modules.example.model import ExampleCreate
 from app.errors.handlers import NotFoundError
+from app.utils.sanitizer import sanitize_dict
+from app.utils.timezone import utc_now
+
+MAX_REPORTED_IMPORT_ERRORS = 100
 
 
 class ExampleService:
     def __init__(self, repository: ExampleRepository = None):
         self.repository = repository or ExampleRepository()
 
-    def get_all(self):
-        return self.repository.get_all()
+    def get_all(self, fields=None, filters=(), sort=()):
+        return self.repository.get_all(fields=fields, filters=filters, sort=sort)
+
+    def count(self, filters=()):
+        return self.repository.count(filters=filters)
 
-    def get_by_id(self, user_id):
-        user = self.repository.get_by_id(user_id)
+    def get_by_id(self, user_id, fields=None):
+        user = self.repository.get_by_id(user_id, fields=fields)
         if not user:
             raise NotFoundError(message="User not found")
         return user
@@ -19,7 +29,75 @@ class ExampleService:
         return self.repository.create(name=name, email=email, age=age)
 
     def delete(self, user_id):
-        user = self.repository.delete(user_id)
-        if not user:
+        if not self.repository.delete(user_id):
             raise NotFoundError(message="User not found")
-        return user
+
+    def bulk_delete(self, ids=None, filters=None, max_rows=None):
+        if ids is not None:
+            return self.repository.delete_many(ids)
+        return self.repository.delete_matching(filters, max_rows=max_rows)
+
+    def purge_deleted(self, retention_days):
+        return self.repository.purge_deleted(before=utc_now() - timedelta(days=retention_days))
+
+    def export_rows(self, fields, batch_size):
+        return self.repository.iter_rows(fields, batch_size)
+
+    def import_records(self, records, batch_size, start=0, on_batch=None):
+        """Validate and insert ``(line_number, record)`` pairs in batches.
+
+        The first ``start`` records are skipped so an interrupted import can
+        resume from its last checkpoint. ``on_batch(summary)`` runs after every
+        committed batch; ``summary["processed"]`` is the checkpoint to resume
+        from. Rows that fail validation or whose email already exists are
+        reported in ``summary["errors"]`` and skipped.
+
+        Accepts what ``export_rows`` produces: unknown columns such as ``id``
+        are ignored, empty CSV cells and nulls count as missing, and ``age``
+        may be missing since exported users can have none.
+        """
+        schema = ExampleCreate(unknown=EXCLUDE, partial=("age",))
+        summary = {"processed": start, "imported": 0, "failed": 0, "errors": []}
+        batch = []
+
+        def reject(line_number, message):
+            summary["failed"] += 1
+            if len(summary["errors"]) < MAX_REPORTED_IMPORT_ERRORS:
+                summary["errors"].append({"line": line_number, "error": message})
+
+        def flush(processed):
+            existing = self.repository.existing_emails([data["email"] for _, data in batch]) if batch else set()
+            rows = []
+            for line_number, data in batch:
+                if data["email"] in existing:
+                    reject(line_number, {"email": ["A user with this email already exists."]})
+                    continue
+                existing.add(data["email"])
+                rows.append(data)
+            if rows:
+                self.repository.insert_many(rows)
+            batch.clear()
+            summary["imported"] += len(rows)
+            summary["processed"] = processed
+            if on_batch:
+                on_batch(summary)
+
+        index = -1
+        for index, (line_number, record) in enumerate(records):
+            if index < start:
+                continue
+            if isinstance(record, str):
+                reject(line_number, record)
+                continue
+            record = {key: value for key, value in record.items() if value not in ("", None)}
+            try:
+                data = schema.load(sanitize_dict(record))
+                data.setdefault("age", None)
+                batch.append((line_number, data))
+            except MarshmallowValidationError as e:
+                reject(line_number, e.messages)
+            if len(batch) >= batch_size:
+                flush(index + 1)
+        if index + 1 > summary["processed"]:
+            flush(index + 1)
+        return summary
@@ -0,0 +1,11 @@
+from datetime import time
+from flask import current_app
+from app.core.jobs import periodic
+from app.modules.example.service import ExampleService
+
+
+@periodic("example.purge_deleted", at=time(3, 0))
+def purge_deleted(retention_days=None):
+    if retention_days is None:
+        retention_days = current_app.config["SOFT_DELETE_RETENTION_DAYS"]
+    ExampleService().purge_deleted(retention_days)
@@ -0,0 +1,18 @@
+import os
+from flask import Blueprint, jsonify, request
+from app.core.query_stats import SORT_KEYS, query_stats
+from app.errors.handlers import ValidationError
+from app.utils.permissions import require_permission
+
+query_stats_bp = Blueprint("query_stats", __name__)
+
+
+@query_stats_bp.route("/query-stats", methods=["GET"])
+@require_permission("query_stats.read")
+def top_queries():
+    """Slowest statement fingerprints seen by this worker: ``?limit=20&sort=total_ms``."""
+    sort = request.args.get("sort", "total_ms")
+    if sort not in SORT_KEYS:
+        raise ValidationError(message={"sort": [f"Must be one of: {', '.join(SORT_KEYS)}"]})
+    limit = min(max(request.args.get("limit", 20, type=int), 1), 100)
+    return jsonify({"pid": os.getpid(), "queries": query_stats.top(limit=limit, sort=sort)}), 200
@@ -1,38 +1,56 @@
-from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
+import io
+from flask import Blueprint, Response, current_app, request, jsonify, stream_with_context
+from flask_jwt_extended import jwt_required
 from marshmallow import ValidationError as MarshmallowValidationError
-from app.extensions import limiter, db
+from sqlalchemy.exc import SQLAlchemyError
+from app.extensions import db, limiter
 from app.utils.sanitizer import sanitize_dict
 from app.utils.permissions import require_permission
-from app.modules.example.model import ExampleCreate, ExampleRead
+from app.utils.rate_limit import declared_cost, item_cost, tiered
+from app.utils.query import effective_filters, parse_fields, parse_filters, parse_sort, projected_schema
+from app.utils.transfer import FORMATS, decode_records, detect_format, encode_rows
+from app.modules.example.policy import ExamplePolicy
+from app.modules.example.model import ExampleBulkDelete, ExampleCreate, ExampleRead, EXAMPLE_FILTERS, EXAMPLE_SORTS
 from app.modules.example.service import ExampleService
-from app.errors.handlers import ValidationError
-from app.database.schema import User
+from app.errors.handlers import InternalServerError, ValidationError
 
 example_bp = Blueprint("example", __name__, url_prefix="/example")
 
 service = ExampleService()
 read_schema = ExampleRead()
 create_schema = ExampleCreate()
+bulk_delete_schema = ExampleBulkDelete()
+policy = ExamplePolicy()
 
 
 @example_bp.route("", methods=["GET"])
 @jwt_required()
-@limiter.limit("30 per minute")
+@limiter.limit(tiered("30 per minute"))
 def list_examples():
-    return jsonify(read_schema.dump(service.get_all(), many=True)), 200
+    fields = parse_fields(request.args.get("fields"), read_schema)
+    filters = parse_filters(request.args, EXAMPLE_FILTERS)
+    sort = parse_sort(request.args.get("sort"), EXAMPLE_SORTS)
+    users = service.get_all(fields=fields, filters=filters, sort=sort)
+    response = jsonify(projected_schema(ExampleRead, fields).dump(users, many=True))
+    if request.args.get("count", "").lower() in ("1", "true"):
+        total, estimated = service.count(filters=filters)
+        response.headers["X-Total-Count"] = str(total)
+        if estimated:
+            response.headers["X-Total-Count-Estimated"] = "true"
+    return response, 200
 
 
 @example_bp.route("/<int:user_id>", methods=["GET"])
 @jwt_required()
-@limiter.limit("30 per minute")
+@limiter.limit(tiered("30 per minute"))
 def get_example(user_id):
-    return jsonify(read_schema.dump(service.get_by_id(user_id))), 200
+    fields = parse_fields(request.args.get("fields"), read_schema)
+    return jsonify(projected_schema(ExampleRead, fields).dump(service.get_by_id(user_id, fields=fields))), 200
 
 
 @example_bp.route("", methods=["POST"])
 @require_permission("example.create")  # layer 1: role-permission check
-@limiter.limit("10 per minute")
+@limiter.limit(tiered("10 per minute"))
 def create_example():
     try:
         data = create_schema.load(sanitize_dict(request.json or {}))
@@ -43,9 +61,89 @@ def create_example():
 
 @example_bp.route("/<int:user_id>", methods=["DELETE"])
 @require_permission("example.delete")  # layer 1: role-permission check
-@limiter.limit("10 per minute")
+@limiter.limit(tiered("10 per minute"))
 def delete_example(user_id):
-    actor = db.session.get(User, get_jwt_identity())
-    # layer 2: ExamplePolicy().delete(actor, target) would go here
+    policy.delete(user_id)  # layer 2: resource rules, reusing current_actor()
     service.delete(user_id)
     return jsonify({"message": "Deleted successfully"}), 200
+
+
+def _bulk_delete_max():
+    return current_app.config["BULK_DELETE_MAX_IDS"]
+
+
+_ids_cost = item_cost("ids")
+_filter_cost = declared_cost("max_rows", _bulk_delete_max)
+
+
+def _bulk_delete_cost():
+    body = request.get_json(silent=True)
+    return _filter_cost() if isinstance(body, dict) and "filter" in body else _ids_cost()
+
+
+@example_bp.route("/bulk-delete", methods=["POST"])
+@require_permission("example.delete")  # layer 1: role-permission check
+@limiter.limit(
+    # Room for one maximum-size request per minute at multiplier 1.0.
+    tiered(lambda: f"{_bulk_delete_max()} per minute"),
+    cost=_bulk_delete_cost,
+)
+def bulk_delete_examples():
+    """Ids requests cost one hit per id. Filter deletes remove at most ``max_rows``
+    rows (default BULK_DELETE_MAX_IDS) and cost that many hits up front."""
+    try:
+        data = bulk_delete_schema.load(request.json or {})
+    except MarshmallowValidationError as e:
+        raise ValidationError(message=e.messages)
+    policy.bulk_delete(ids=data.get("ids"))  # layer 2: resource rules, reusing current_actor()
+    if "ids" in data:
+        deleted = service.bulk_delete(ids=data["ids"])
+    else:
+        filters = effective_filters(parse_filters(data["filter"], EXAMPLE_FILTERS, reserved=()))
+        if not filters:
+            raise ValidationError(message={"filter": ["Must contain at least one condition."]})
+        deleted = service.bulk_delete(filters=filters, max_rows=data.get("max_rows", _bulk_delete_max()))
+    return jsonify({"deleted": deleted}), 200
+
+
+@example_bp.route("/export", methods=["GET"])
+@require_permission("example.export")
+@limiter.limit(tiered("5 per minute"))
+def export_examples():
+    fmt = request.args.get("format", "ndjson")
+    if fmt not in FORMATS:
+        raise ValidationError(message={"format": [f"Must be one of: {', '.join(FORMATS)}"]})
+    batch_size = current_app.config["EXPORT_BATCH_SIZE"]
+    fields = tuple(read_schema.fields)
+    chunks = encode_rows(service.export_rows(fields, batch_size), fields, fmt, batch_size)
+    return Response(
+        stream_with_context(chunks),
+        mimetype=FORMATS[fmt],
+        headers={"Content-Disposition": f"attachment; filename=users.{fmt}"},
+    )
+
+
+@example_bp.route("/import", methods=["POST"])
+@require_permission("example.create")
+@limiter.limit(tiered("5 per minute"))
+def import_examples():
+    """Stream a CSV/NDJSON body in. Resume a partial import with ``?start=<processed>``."""
+    fmt = request.args.get("format") or detect_format(content_type=request.mimetype)
+    if fmt not in FORMATS:
+        raise ValidationError(message={"format": [f"Must be one of: {', '.join(FORMATS)}"]})
+    start = request.args.get("start", 0, type=int)
+    # utf-8-sig drops a leading BOM, which would otherwise corrupt the first CSV header.
+    text = io.TextIOWrapper(io.BufferedReader(request.stream), encoding="utf-8-sig", newline="")
+    committed = {"processed": start}
+    try:
+        summary = service.import_records(
+            decode_records(text, fmt), current_app.config["IMPORT_BATCH_SIZE"], start=start,
+            on_batch=lambda progress: committed.update(processed=progress["processed"]),
+        )
+    except UnicodeDecodeError:
+        raise ValidationError(message={"body": ["Must be UTF-8 encoded."], **committed})
+    except SQLAlchemyError:
+        db.session.rollback()
+        current_app.logger.exception("Import failed after %s records", committed["processed"])
+        raise InternalServerError(message={"import": ["Database error; resume with ?start=<processed>."], **committed})
+    return jsonify(summary), 200
@@ -1,4 +1,5 @@
 from functools import wraps
+from flask import g
 from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
 from app.errors.handlers import ForbiddenError, UnauthorizedError
 
@@ -9,11 +10,23 @@ def _get_actor():
 
     identity = get_jwt_identity()
     user = db.session.get(User, int(identity))
-    if not user:
+    if not user or user.deleted_at is not None:
         raise UnauthorizedError()
     return user
 
 
+def current_actor():
+    """The authenticated User for this request, loaded once and kept on ``g``.
+
+    Routes, policies and services should call this instead of looking the
+    user up again; require_permission has usually filled it already.
+    """
+    if "actor" not in g:
+        verify_jwt_in_request()
+        g.actor = _get_actor()
+    return g.actor
+
+
 def has_permission(actor, permission: str) -> bool:
     if not actor.role:
         return False
@@ -25,8 +38,7 @@ def require_permission(permission: str):
         @wraps(fn)
         def wrapper(*args, **kwargs):
             verify_jwt_in_request()
-            actor = _get_actor()
-            if not has_permission(actor, permission):
+            if not has_permission(current_actor(), permission):
                 raise ForbiddenError()
             return fn(*args, **kwargs)
         return wrapper
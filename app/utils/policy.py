@@ -1,5 +1,5 @@
 from app.errors.handlers import ForbiddenError
-from app.utils.permissions import has_permission
+from app.utils.permissions import current_actor, has_permission
 
 
 class BasePolicy:
@@ -8,12 +8,17 @@ class BasePolicy:
 
     Usage:
         class EmployeePolicy(BasePolicy):
-            def terminate(self, actor, employee):
-                self.authorize(actor, "employee.terminate")
+            def terminate(self, employee, actor=None):
+                actor = self.authorize(actor, "employee.terminate")
                 if actor.role.name == "hr_manager" and actor.department_id != employee.department_id:
                     raise ForbiddenError("You can only terminate employees in your department.")
+
+    Pass ``actor=None`` to use the request's current_actor() instead of
+    loading the user again.
     """
 
     def authorize(self, actor, permission: str):
+        actor = actor if actor is not None else current_actor()
         if not has_permission(actor, permission):
             raise ForbiddenError()
+        return actor
@@ -0,0 +1,145 @@
+import sys
+import time
+from functools import lru_cache
+from app.errors.handlers import ValidationError
+
+
+def parse_fields(raw, schema):
+    """Parse a ``?fields=id,name`` sparse fieldset against a marshmallow schema.
+
+    Returns the requested field names in declaration order, or every declared
+    field when nothing was requested. Unknown names raise ValidationError so
+    the list can be trusted as a column projection further down.
+    """
+    declared = tuple(schema.fields)
+    requested = {name.strip() for name in (raw or "").split(",") if name.strip()}
+    if not requested:
+        return declared
+    unknown = sorted(requested - set(declared))
+    if unknown:
+        raise ValidationError(message={"fields": [f"Unknown field: {name}" for name in unknown]})
+    return tuple(name for name in declared if name in requested)
+
+
+@lru_cache(maxsize=128)
+def projected_schema(schema_cls, only):
+    """Return a cached ``schema_cls(only=only)`` instance; building schemas per request is not free."""
+    return schema_cls(only=only)
+
+
+RESERVED_PARAMS = frozenset({"fields", "sort", "count"})
+MAX_FILTERS = 8
+MAX_SORT_KEYS = 2
+
+
+def parse_filters(args, allowed, reserved=RESERVED_PARAMS):
+    """Parse ``?age__gte=18&email__prefix=jane`` style query args.
+
+    ``allowed`` maps a column name to ``(operators, convert)``; only those
+    names and operators are accepted, so callers should whitelist indexed
+    columns only. A bare ``name=value`` means ``eq``. Keys in ``reserved``
+    are skipped; pass ``reserved=()`` for a JSON body, where ``fields`` or
+    ``count`` can only be a mistake. Returns a list of ``(name, op, value)``
+    triples with converted values.
+    """
+    filters = []
+    errors = []
+    items = args.items(multi=True) if hasattr(args, "getlist") else args.items()
+    for key, raw in items:
+        if key in reserved:
+            continue
+        name, _, op = key.partition("__")
+        op = op or "eq"
+        if name not in allowed or op not in allowed[name][0]:
+            errors.append(f"Unsupported filter: {key}")
+            continue
+        try:
+            filters.append((name, op, allowed[name][1](raw)))
+        except (TypeError, ValueError):
+            errors.append(f"Invalid value for {key}: {raw}")
+    if len(filters) > MAX_FILTERS:
+        errors.append(f"At most {MAX_FILTERS} filters are allowed")
+    if errors:
+        raise ValidationError(message={"filters": errors})
+    return filters
+
+
+def parse_sort(raw, allowed):
+    """Parse ``?sort=-created_at,id`` into ``[(name, descending), ...]`` against a whitelist."""
+    keys = [key.strip() for key in (raw or "").split(",") if key.strip()]
+    if len(keys) > MAX_SORT_KEYS:
+        raise ValidationError(message={"sort": [f"At most {MAX_SORT_KEYS} sort keys are allowed"]})
+    sort = []
+    for key in keys:
+        name = key.lstrip("-")
+        if name not in allowed:
+            raise ValidationError(message={"sort": [f"Unsupported sort key: {name}"]})
+        sort.append((name, key.startswith("-")))
+    return sort
+
+
+def _prefix_upper_bound(prefix):
+    # "jane" -> "janf": a half-open range that any b-tree index can seek,
+    # unlike LIKE 'jane%' which SQLite only indexes under special collations.
+    # Trailing U+10FFFF can't be incremented; bump the character before it,
+    # or return None (no upper bound) when every character is the maximum.
+    # The successor skips the surrogate block, which can't be encoded.
+    stripped = prefix.rstrip(chr(sys.maxunicode))
+    if not stripped:
+        return None
+    successor = ord(stripped[-1]) + 1
+    if 0xD800 <= successor <= 0xDFFF:
+        successor = 0xE000
+    return stripped[:-1] + chr(successor)
+
+
+def _prefix_range(column, prefix):
+    upper = _prefix_upper_bound(prefix)
+    return column >= prefix if upper is None else (column >= prefix) & (column < upper)
+
+
+_OPERATORS = {
+    "eq": lambda column, value: column == value,
+    "ne": lambda column, value: column != value,
+    "lt": lambda column, value: column < value,
+    "lte": lambda column, value: column <= value,
+    "gt": lambda column, value: column > value,
+    "gte": lambda column, value: column >= value,
+    "prefix": _prefix_range,
+}
+
+
+def effective_filters(filters):
+    """The filters that actually constrain a query; an empty prefix matches everything."""
+    return [(name, op, value) for name, op, value in filters if op != "prefix" or value]
+
+
+def apply_filters(stmt, model, filters):
+    for name, op, value in effective_filters(filters):
+        stmt = stmt.where(_OPERATORS[op](getattr(model, name), value))
+    return stmt
+
+
+def apply_sort(stmt, model, sort):
+    for name, descending in sort:
+        column = getattr(model, name)
+        stmt = stmt.order_by(column.desc() if descending else column.asc())
+    return stmt
+
+
+_count_cache = {}
+
+
+def cached_count(key, ttl, compute):
+    """Memoize ``compute()`` under ``key`` for ``ttl`` seconds, per process.
+
+    Meant for unfiltered table counts only, so the cache holds one entry
+    per table and never grows with user input.
+    """
+    now = time.monotonic()
+    hit = _count_cache.get(key)
+    if hit and now - hit[0] < ttl:
+        return hit[1]
+    value = compute()
+    _count_cache[key] = (now, value)
+    return value
@@ -0,0 +1,101 @@
+"""Rate-limit keys, role tiers and request costs for Flask-Limiter.
+
+Authenticated callers get their own bucket keyed by JWT identity; anonymous
+ones fall back to the client IP (see RATELIMIT_TRUSTED_PROXIES). Route
+limits declared with ``tiered("30 per minute")`` are scaled by the caller's
+``Role.rate_limit_multiplier``, and ``cost=`` callables let bulk endpoints
+charge per item or per declared row cap. Costs are always known before the
+view runs. Each decorated route still has exactly one limit, so a request
+costs one counter increment in the limiter storage.
+"""
+import time
+import threading
+
+from flask import current_app, request
+from flask_jwt_extended import get_jwt, get_jwt_identity, verify_jwt_in_request
+from flask_jwt_extended.exceptions import JWTExtendedException
+from jwt.exceptions import PyJWTError
+
+_role_multipliers = {"loaded_at": float("-inf"), "values": {}}
+_role_lock = threading.Lock()
+
+
+def _verified_claims():
+    try:
+        verify_jwt_in_request(optional=True)
+    except (JWTExtendedException, PyJWTError):
+        # A bad token is rejected by the route's own auth check; here it
+        # just means "anonymous".
+        return None
+    return get_jwt() or None
+
+
+def rate_limit_key():
+    if _verified_claims():
+        return f"user:{get_jwt_identity()}"
+    return f"ip:{request.remote_addr}"
+
+
+def _role_multiplier(role):
+    from app.database.schema import Role
+    from app.extensions import db
+
+    ttl = current_app.config["RATELIMIT_ROLE_CACHE_TTL"]
+    now = time.monotonic()
+    if now - _role_multipliers["loaded_at"] >= ttl:
+        with _role_lock:
+            if now - _role_multipliers["loaded_at"] >= ttl:
+                rows = db.session.execute(db.select(Role.name, Role.rate_limit_multiplier)).all()
+                _role_multipliers["values"] = {name: multiplier for name, multiplier in rows}
+                _role_multipliers["loaded_at"] = now
+    return _role_multipliers["values"].get(role) or 1.0
+
+
+def tiered(base):
+    """Return a limit callable: ``base`` (e.g. ``"30 per minute"``) times the caller's role multiplier.
+
+    ``base`` may also be a callable returning that string, for limits derived
+    from app config.
+    """
+    def limit():
+        amount, _, period = (base() if callable(base) else base).partition(" per ")
+        amount = int(amount)
+        claims = _verified_claims()
+        role = claims.get("role") if claims else None
+        multiplier = _role_multiplier(role) if role else 1.0
+        return f"{max(1, int(amount * multiplier))} per {period}"
+
+    return limit
+
+
+def item_cost(field, default=1):
+    """Cost callable charging one hit per element of the JSON list ``field``, or ``default`` without one."""
+    def cost():
+        body = request.get_json(silent=True)
+        items = body.get(field) if isinstance(body, dict) else None
+        return max(1, len(items)) if isinstance(items, list) else default
+    return cost
+
+
+def declared_cost(field, maximum):
+    """Cost callable charging the JSON integer ``field`` (e.g. a row cap), or ``maximum()`` when it is absent or invalid."""
+    def cost():
+        cap = maximum()
+        body = request.get_json(silent=True)
+        value = body.get(field) if isinstance(body, dict) else None
+        valid = isinstance(value, int) and not isinstance(value, bool) and 0 < value <= cap
+        return value if valid else cap
+    return cost
+
+
+def add_role_claim(identity):
+    """JWT additional-claims loader: embed the user's role name so tier lookups
+    don't need a per-request user query."""
+    from app.database.schema import User
+    from app.extensions import db
+
+    try:
+        user = db.session.get(User, int(identity))
+    except (TypeError, ValueError):
+        return {}
+    return {"role": user.role.name} if user and user.role else {}
@@ -0,0 +1,42 @@
+"""Slotted read models for column-projected queries.
+
+``read_model("UserRow", ("id", "name"))`` returns a class with ``__slots__``
+for exactly those fields, built once per field tuple. Instances are filled
+straight from SQLAlchemy ``Row`` results: no session, no identity map, no
+relationship loaders, only the attributes a marshmallow schema dumps.
+"""
+from functools import lru_cache
+
+
+class ReadModel:
+    __slots__ = ()
+    _fields = ()
+
+    def __init__(self, *values):
+        for field, value in zip(self._fields, values):
+            setattr(self, field, value)
+
+    @classmethod
+    def from_rows(cls, rows):
+        return [cls(*row) for row in rows]
+
+    def _asdict(self):
+        return {field: getattr(self, field) for field in self._fields}
+
+    def __iter__(self):
+        return (getattr(self, field) for field in self._fields)
+
+    def __eq__(self, other):
+        if not isinstance(other, ReadModel):
+            return NotImplemented
+        return self._fields == other._fields and tuple(self) == tuple(other)
+
+    def __repr__(self):
+        values = ", ".join(f"{field}={getattr(self, field)!r}" for field in self._fields)
+        return f"{type(self).__name__}({values})"
+
+
+@lru_cache(maxsize=128)
+def read_model(name, fields):
+    """Return the cached ReadModel subclass called ``name`` with slots for ``fields`` (a tuple)."""
+    return type(name, (ReadModel,), {"__slots__": fields, "_fields": fields})
@@ -0,0 +1,69 @@
+"""Streaming CSV / NDJSON encoding and decoding for bulk export and import.
+
+Everything here works on iterators, one batch at a time, so memory stays flat
+no matter how many rows go through.
+"""
+import csv
+import io
+import json
+
+FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def encode_rows(rows, fieldnames, fmt, batch_size=1000):
+    """Yield ``rows`` (attribute-style, e.g. SQLAlchemy Rows) as text chunks of up to ``batch_size`` rows."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n") if fmt == "csv" else None
+    if writer:
+        writer.writerow(fieldnames)
+    pending = 0
+    for row in rows:
+        values = [getattr(row, name) for name in fieldnames]
+        if writer:
+            writer.writerow(values)
+        else:
+            buffer.write(json.dumps(dict(zip(fieldnames, values)), default=str))
+            buffer.write("\n")
+        pending += 1
+        if pending >= batch_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def decode_records(text_stream, fmt):
+    """Yield ``(line_number, record_or_error)`` pairs from a text stream.
+
+    A line that can't be parsed yields a ``str`` error message in place of the
+    record dict, so one bad line doesn't abort the whole import.
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(text_stream)
+        for record in reader:
+            yield reader.line_num, record
+        return
+    for line_number, line in enumerate(text_stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield line_number, f"Invalid JSON: {e}"
+            continue
+        yield line_number, record if isinstance(record, dict) else "Expected a JSON object"
+
+
+def detect_format(filename=None, content_type=None):
+    if content_type:
+        for fmt, mimetype in FORMATS.items():
+            if content_type.startswith(mimetype):
+                return fmt
+    if filename and filename.endswith(".csv"):
+        return "csv"
+    return "ndjson"
@@ -0,0 +1,41 @@
+"""CPU-versus-bytes tradeoff of the response compression levels.
+
+Compresses a serialized ``GET /example`` listing with every available
+encoding at a range of levels and prints time per body and output size.
+
+    python -m benchmarks.compression [rows]
+"""
+import json
+import sys
+import timeit
+
+from app.core.compression import ENCODERS, compress
+
+LEVELS = {
+    "gzip": (1, 3, 6, 9),
+    "deflate": (1, 6, 9),
+    "br": (1, 4, 6, 11),
+    "zstd": (1, 3, 9, 19),
+}
+
+
+def listing(rows):
+    return json.dumps([
+        {"id": i, "name": f"User {i}", "email": f"user{i}@example.com", "age": 18 + i % 60}
+        for i in range(rows)
+    ]).encode()
+
+
+def main(rows=10_000):
+    body = listing(rows)
+    print(f"{rows} rows, {len(body):,} bytes uncompressed\n")
+    print(f"{'encoding':<9} {'level':>5} {'ms/body':>9} {'bytes':>10} {'ratio':>6}")
+    for encoding in ENCODERS:
+        for level in LEVELS[encoding]:
+            runs, total = timeit.Timer(lambda: compress(body, encoding, level)).autorange()
+            size = len(compress(body, encoding, level))
+            print(f"{encoding:<9} {level:>5} {total / runs * 1000:>9.2f} {size:>10,} {len(body) / size:>6.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,133 @@
+"""Throughput and latency of the gunicorn worker profiles.
+
+Seeds a throwaway SQLite database, then starts gunicorn with each profile
+from gunicorn.conf.py in turn and drives it with concurrent keep-alive
+clients against the example endpoints. The benchmark role gets a large
+rate_limit_multiplier so the route limits don't cut the run short.
+
+    python -m benchmarks.gunicorn_profiles [--profiles sync,gthread] [--clients 32] [--seconds 10]
+
+Profiles whose worker class isn't installed (gevent) are skipped.
+"""
+import argparse
+import http.client
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from importlib.util import find_spec
+
+PORT = 8765
+PATHS = ["/example?fields=id,name,email&sort=-created_at", "/example/1"]
+PROFILE_MODULES = {"gevent": "gevent"}
+
+
+def seed(db_path, rows=200):
+    """Create the schema and a token-holding admin in ``db_path``; return the auth header."""
+    os.environ.update(DATABASE_URL=f"sqlite:///{db_path}", FLASK_ENV="development")
+    from flask_jwt_extended import create_access_token
+
+    from app import create_app
+    from app.database.schema import Role, User
+    from app.extensions import db
+
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        role = Role(name="benchmark", description="Benchmark", rate_limit_multiplier=1_000_000)
+        db.session.add(role)
+        db.session.add_all(
+            User(name=f"User {i}", email=f"user{i}@example.com", age=20 + i % 50, role=role)
+            for i in range(rows)
+        )
+        db.session.commit()
+        token = create_access_token(identity="1")
+    return {"Authorization": f"Bearer {token}"}
+
+
+def wait_ready(timeout=15):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", PORT, timeout=1)
+            conn.request("GET", "/health")
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError("gunicorn did not come up")
+
+
+def client_loop(headers, stop, latencies, errors):
+    conn = http.client.HTTPConnection("127.0.0.1", PORT, timeout=10)
+    i = 0
+    while not stop.is_set():
+        started = time.perf_counter()
+        try:
+            conn.request("GET", PATHS[i % len(PATHS)], headers=headers)
+            res = conn.getresponse()
+            res.read()
+            if res.status != 200:
+                errors.append(res.status)
+        except (OSError, http.client.HTTPException):
+            errors.append("conn")
+            conn.close()
+            conn = http.client.HTTPConnection("127.0.0.1", PORT, timeout=10)
+            continue
+        latencies.append(time.perf_counter() - started)
+        i += 1
+
+
+def run_profile(profile, headers, clients, seconds):
+    env = dict(os.environ, GUNICORN_PROFILE=profile, GUNICORN_BIND=f"127.0.0.1:{PORT}")
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "wsgi:app"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_ready()
+        stop, latencies, errors = threading.Event(), [], []
+        threads = [
+            threading.Thread(target=client_loop, args=(headers, stop, latencies, errors))
+            for _ in range(clients)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+    finally:
+        server.terminate()
+        server.wait()
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99)] if latencies else 0
+    return len(latencies) / seconds, statistics.median(latencies or [0]), p99, len(errors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profiles", default="sync,gthread,gevent")
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--seconds", type=float, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        headers = seed(os.path.join(tmp, "bench.db"))
+        print(f"{'profile':<10} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+        for profile in args.profiles.split(","):
+            module = PROFILE_MODULES.get(profile)
+            if module and find_spec(module) is None:
+                print(f"{profile:<10} skipped ({module} not installed)")
+                continue
+            rps, p50, p99, errors = run_profile(profile, headers, args.clients, args.seconds)
+            print(f"{profile:<10} {rps:>9.0f} {p50 * 1000:>8.1f} {p99 * 1000:>8.1f} {errors:>7}")
+
+
+if __name__ == "__main__":
+    main()
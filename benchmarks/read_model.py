@@ -0,0 +1,74 @@
+"""Memory per listed row: ORM instances vs slotted read models.
+
+Loads 100k users into an in-memory SQLite database and measures, with
+tracemalloc, the memory still held after materializing the listing as
+session-tracked ``User`` instances (with their joined ``Role``) and as the
+``UserRow`` read models ``ExampleRepository.get_all`` returns.
+
+    python -m benchmarks.read_model [--rows 100000]
+"""
+import argparse
+import gc
+import os
+import tracemalloc
+
+os.environ["FLASK_ENV"] = "testing"
+
+from app import create_app  # noqa: E402
+from app.database.schema import Role, User  # noqa: E402
+from app.extensions import db  # noqa: E402
+from app.modules.example.repository import ExampleRepository  # noqa: E402
+
+
+def seed(rows):
+    role = Role(name="member", description="Member")
+    db.session.add(role)
+    db.session.flush()
+    db.session.execute(db.insert(User), [
+        {"name": f"User {i}", "email": f"user{i}@example.com", "age": 20 + i % 50, "role_id": role.id}
+        for i in range(rows)
+    ])
+    db.session.commit()
+
+
+def measure(load):
+    """Return ``(bytes held, peak bytes, row count)`` for the list ``load()`` returns."""
+    db.session.expunge_all()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = load()
+    gc.collect()
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    count = len(result)
+    del result
+    db.session.expunge_all()
+    return held - before, peak - before, count
+
+
+def orm_listing():
+    stmt = db.select(User).where(User.deleted_at.is_(None))
+    return db.session.execute(stmt).unique().scalars().all()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        seed(args.rows)
+        print(f"{'':<12} {'bytes/row':>10} {'peak bytes/row':>15}")
+        results = {}
+        for label, load in (("ORM", orm_listing), ("read model", ExampleRepository().get_all)):
+            held, peak, count = measure(load)
+            results[label] = held / count
+            print(f"{label:<12} {held / count:>10.0f} {peak / count:>15.0f}")
+        print(f"read models hold {results['ORM'] / results['read model']:.1f}x less memory per row")
+
+
+if __name__ == "__main__":
+    main()
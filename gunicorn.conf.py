@@ -0,0 +1,111 @@
+"""Gunicorn configuration, driven by environment variables.
+
+GUNICORN_PROFILE selects the worker model:
+
+    gthread  processes x threads (default). Suits this API: requests mostly
+             wait on the database, and threads share one connection pool
+             per process.
+    sync     one request at a time per process. Most isolation, highest
+             memory per concurrent request.
+    gevent   cooperative greenlets for many slow or idle connections.
+             Requires `pip install gevent`; the app is not preloaded.
+
+Every value can be overridden on its own: WEB_CONCURRENCY (workers),
+GUNICORN_THREADS, GUNICORN_WORKER_CONNECTIONS, GUNICORN_KEEPALIVE,
+GUNICORN_TIMEOUT, GUNICORN_MAX_REQUESTS, GUNICORN_MAX_REQUESTS_JITTER,
+GUNICORN_MAX_WORKER_MEMORY_MB, GUNICORN_PRELOAD and GUNICORN_BIND.
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+import os
+
+
+def _available_cpus():
+    # Honour container CPU quotas (cgroup v2) rather than the host core count.
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            return max(1, int(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _env_int(name, default):
+    return int(os.getenv(name, default))
+
+
+CPUS = _available_cpus()
+
+PROFILES = {
+    "sync": {"worker_class": "sync", "workers": CPUS * 2 + 1, "threads": 1, "preload_app": True},
+    "gthread": {"worker_class": "gthread", "workers": CPUS + 1, "threads": 4, "preload_app": True},
+    "gevent": {"worker_class": "gevent", "workers": CPUS, "threads": 1, "preload_app": False},
+}
+
+profile_name = os.getenv("GUNICORN_PROFILE", "gthread")
+try:
+    profile = PROFILES[profile_name]
+except KeyError:
+    raise SystemExit(f"Unknown GUNICORN_PROFILE {profile_name!r}; expected one of {', '.join(PROFILES)}")
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+worker_class = profile["worker_class"]
+workers = _env_int("WEB_CONCURRENCY", profile["workers"])
+threads = _env_int("GUNICORN_THREADS", profile["threads"])
+worker_connections = _env_int("GUNICORN_WORKER_CONNECTIONS", 1000)
+
+# Load the app once in the master so workers share its memory pages
+# copy-on-write; post_fork below drops any DB connections inherited from it.
+preload_app = os.getenv("GUNICORN_PRELOAD", str(profile["preload_app"])).lower() == "true"
+
+# Keep-alive should outlast the load balancer's idle timeout, or the LB may
+# reuse a connection gunicorn has just closed (intermittent 502s).
+keepalive = _env_int("GUNICORN_KEEPALIVE", 5)
+timeout = _env_int("GUNICORN_TIMEOUT", 30)
+graceful_timeout = _env_int("GUNICORN_GRACEFUL_TIMEOUT", 30)
+
+# Recycle workers to cap slow memory creep; the jitter keeps them from all
+# restarting at once.
+max_requests = _env_int("GUNICORN_MAX_REQUESTS", 1000)
+max_requests_jitter = _env_int("GUNICORN_MAX_REQUESTS_JITTER", 100)
+max_worker_memory_mb = _env_int("GUNICORN_MAX_WORKER_MEMORY_MB", 0)
+
+# Heartbeat files on tmpfs; a disk-backed /tmp can block workers in Docker.
+worker_tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+accesslog = "-"
+errorlog = "-"
+
+
+def _rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def post_fork(server, worker):
+    # Connections opened in the master (preload_app) must not be shared with
+    # the children; close=False leaves the parent's sockets alone.
+    if not server.cfg.preload_app:
+        # Nothing inherited. Importing the app here would also run before the
+        # gevent worker monkey-patches in init_process().
+        return
+    from app.extensions import db
+    from wsgi import app
+
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+
+
+def post_request(worker, req, environ, resp):
+    if max_worker_memory_mb and _rss_mb() > max_worker_memory_mb:
+        worker.log.info("Worker %s above %sMB RSS, recycling", worker.pid, max_worker_memory_mb)
+        worker.alive = False
@@ -0,0 +1,26 @@
+"""add roles rate_limit_multiplier
+
+Revision ID: 0a6d4e8b3f19
+Revises: f1c7d3a95e62
+Create Date: 2026-10-19 19:05:36.770412
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0a6d4e8b3f19'
+down_revision = 'f1c7d3a95e62'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('roles', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('rate_limit_multiplier', sa.Float(), server_default='1.0', nullable=False))
+
+
+def downgrade():
+    with op.batch_alter_table('roles', schema=None) as batch_op:
+        batch_op.drop_column('rate_limit_multiplier')
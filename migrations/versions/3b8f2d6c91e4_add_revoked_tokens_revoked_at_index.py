@@ -0,0 +1,26 @@
+"""add revoked_tokens revoked_at index
+
+Revision ID: 3b8f2d6c91e4
+Revises: 0a6d4e8b3f19
+Create Date: 2026-10-19 21:14:02.118530
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b8f2d6c91e4'
+down_revision = '0a6d4e8b3f19'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('revoked_tokens', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_revoked_tokens_revoked_at'), ['revoked_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('revoked_tokens', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_revoked_tokens_revoked_at'))
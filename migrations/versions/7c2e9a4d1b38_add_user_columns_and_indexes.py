@@ -0,0 +1,39 @@
+"""add user columns and indexes
+
+Revision ID: 7c2e9a4d1b38
+Revises: 051eafdbfffb
+Create Date: 2026-10-19 09:12:44.318207
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c2e9a4d1b38'
+down_revision = '051eafdbfffb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # batch mode so the ALTERs also work on SQLite (table copy-and-move)
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('timezone', sa.String(length=64), nullable=False, server_default='Asia/Manila'))
+        batch_op.add_column(sa.Column('created_at', sa.DateTime(timezone=True), nullable=True))
+        batch_op.create_index(batch_op.f('ix_users_role_id'), ['role_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_users_created_at'), ['created_at'], unique=False)
+
+    with op.batch_alter_table('role_permissions', schema=None) as batch_op:
+        batch_op.create_index('ix_role_permissions_permission_id', ['permission_id', 'role_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('role_permissions', schema=None) as batch_op:
+        batch_op.drop_index('ix_role_permissions_permission_id')
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_users_created_at'))
+        batch_op.drop_index(batch_op.f('ix_users_role_id'))
+        batch_op.drop_column('created_at')
+        batch_op.drop_column('timezone')
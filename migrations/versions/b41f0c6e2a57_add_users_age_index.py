@@ -0,0 +1,26 @@
+"""add users age index
+
+Revision ID: b41f0c6e2a57
+Revises: 7c2e9a4d1b38
+Create Date: 2026-10-19 11:40:02.551930
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b41f0c6e2a57'
+down_revision = '7c2e9a4d1b38'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_users_age'), ['age'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_users_age'))
@@ -0,0 +1,28 @@
+"""add users deleted_at
+
+Revision ID: e5b28c90d7a1
+Revises: d93a7e15c4f0
+Create Date: 2026-10-19 15:26:51.117384
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5b28c90d7a1'
+down_revision = 'd93a7e15c4f0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True))
+        batch_op.create_index(batch_op.f('ix_users_deleted_at'), ['deleted_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_users_deleted_at'))
+        batch_op.drop_column('deleted_at')
@@ -0,0 +1,52 @@
+from collections import Counter
+
+import pytest
+from flask import g
+
+from app.core.duplicate_loads import DuplicateLoadError
+from app.database.schema import User
+from app.errors.handlers import ForbiddenError
+from app.extensions import db
+from app.utils.permissions import current_actor
+from app.utils.policy import BasePolicy
+
+
+def test_current_actor_loaded_once(app, auth_headers):
+    with app.test_request_context(headers=auth_headers):
+        db.session.expunge_all()
+        g._pk_loads = Counter()
+        actor = current_actor()
+        assert current_actor() is actor
+        assert g._pk_loads[("User", (actor.id,))] == 1
+
+
+def test_policy_uses_current_actor(app, auth_headers):
+    with app.test_request_context(headers=auth_headers):
+        assert BasePolicy().authorize(None, "example.delete") is current_actor()
+        with pytest.raises(ForbiddenError):
+            BasePolicy().authorize(None, "example.missing")
+
+
+def test_duplicate_load_detected(app, auth_headers):
+    with app.test_request_context():
+        user_id = db.session.execute(db.select(User.id).filter_by(email="test@example.com")).scalar_one()
+        db.session.expunge_all()
+        g._pk_loads = Counter()
+        db.session.get(User, user_id)
+        db.session.expire_all()
+        with pytest.raises(DuplicateLoadError, match="loaded more than once"):
+            db.session.get(User, user_id).name
+
+
+def test_delete_request_loads_actor_once(client, auth_headers):
+    created = client.post("/example", json={"name": "Once Only", "email": "once@example.com", "age": 30}, headers=auth_headers)
+    res = client.delete(f"/example/{created.get_json()['id']}", headers=auth_headers)
+    assert res.status_code == 200
+
+
+def test_delete_own_account_forbidden(client, auth_headers):
+    with client.application.test_request_context(headers=auth_headers):
+        actor_id = current_actor().id
+    assert client.delete(f"/example/{actor_id}", headers=auth_headers).status_code == 403
+    res = client.post("/example/bulk-delete", json={"ids": [999_999, actor_id]}, headers=auth_headers)
+    assert res.status_code == 403
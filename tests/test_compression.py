@@ -0,0 +1,76 @@
+import gzip
+import json
+import zlib
+
+import pytest
+from flask import Flask, Response, jsonify
+
+from app.core.compression import init_compression
+from app.core.config import TestingConfig
+
+ROWS = [{"id": i, "name": f"User {i}", "email": f"user{i}@example.com", "age": 30} for i in range(200)]
+
+
+@pytest.fixture()
+def compressed_app():
+    app = Flask(__name__)
+    app.config.from_object(TestingConfig)
+
+    @app.route("/big")
+    def big():
+        return jsonify(ROWS)
+
+    @app.route("/small")
+    def small():
+        return jsonify({"status": "ok"})
+
+    @app.route("/stream")
+    def stream():
+        return Response((json.dumps(row) + "\n" for row in ROWS), mimetype="application/x-ndjson")
+
+    init_compression(app)
+    return app
+
+
+def test_gzip_when_accepted(compressed_app):
+    res = compressed_app.test_client().get("/big", headers={"Accept-Encoding": "gzip"})
+    assert res.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in res.headers["Vary"]
+    assert json.loads(gzip.decompress(res.data)) == ROWS
+
+
+def test_deflate_when_preferred(compressed_app):
+    res = compressed_app.test_client().get("/big", headers={"Accept-Encoding": "gzip;q=0.5, deflate"})
+    assert res.headers["Content-Encoding"] == "deflate"
+    assert json.loads(zlib.decompress(res.data)) == ROWS
+
+
+def test_identity_without_accept_encoding(compressed_app):
+    res = compressed_app.test_client().get("/big")
+    assert "Content-Encoding" not in res.headers
+    assert res.get_json() == ROWS
+
+
+def test_small_body_not_compressed(compressed_app):
+    res = compressed_app.test_client().get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in res.headers
+
+
+def test_streamed_response_compressed(compressed_app):
+    res = compressed_app.test_client().get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert res.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in res.headers
+    lines = gzip.decompress(res.data).decode().splitlines()
+    assert [json.loads(line) for line in lines] == ROWS
+
+
+def test_cache_reuses_compressed_body(compressed_app):
+    client = compressed_app.test_client()
+    first = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    cache = compressed_app.extensions["compression_cache"]
+    size = cache.size
+    second = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert first.data == second.data
+    assert first.headers["ETag"] == second.headers["ETag"]
+    assert first.headers["ETag"].endswith('-gzip"')
+    assert cache.size == size > 0
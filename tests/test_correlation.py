@@ -0,0 +1,67 @@
+import re
+
+from sqlalchemy import event
+
+from app.core.correlation import CorrelationIdGenerator, _comment_statement, correlation_id_from
+from app.extensions import db
+
+ULID = re.compile(r"[0-9A-HJKMNP-TV-Z]{26}")
+
+
+def test_generated_ids_are_unique_and_ordered():
+    generate = CorrelationIdGenerator()
+    ids = [generate() for _ in range(5000)]
+    assert all(ULID.fullmatch(i) for i in ids)
+    assert len(set(ids)) == len(ids)
+    assert ids == sorted(ids)
+
+
+def test_reseed_changes_prefix():
+    generate = CorrelationIdGenerator()
+    before = generate()
+    generate.reseed()
+    assert generate()[10:18] != before[10:18]
+
+
+def test_inbound_ids_are_validated_and_truncated():
+    assert correlation_id_from("req-123.abc:1", 64) == "req-123.abc:1"
+    assert correlation_id_from("a" * 500, 64) == "a" * 64
+    assert ULID.fullmatch(correlation_id_from("bad id */ DROP", 64))
+    assert ULID.fullmatch(correlation_id_from(None, 64))
+
+
+def test_response_echoes_sanitized_header(client):
+    assert client.get("/health", headers={"X-Correlation-ID": "abc-1"}).headers["X-Correlation-ID"] == "abc-1"
+    generated = client.get("/health", headers={"X-Correlation-ID": "x" * 10 + "é"}).headers["X-Correlation-ID"]
+    assert ULID.fullmatch(generated)
+
+
+def _captured_statements(client, headers):
+    statements = []
+
+    def capture(conn, cursor, statement, *_):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        client.get("/example", headers=headers)
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+    assert statements
+    return statements
+
+
+def test_sql_comments_are_off_by_default(app, client, auth_headers):
+    assert not app.config["CORRELATION_ID_SQL_COMMENTS"]
+    statements = _captured_statements(client, {**auth_headers, "X-Correlation-ID": "trace-41"})
+    assert not any("correlation_id" in s for s in statements)
+
+
+def test_statements_carry_correlation_comment(client, auth_headers):
+    # Registered the way init_correlation does with CORRELATION_ID_SQL_COMMENTS on.
+    event.listen(db.engine, "before_cursor_execute", _comment_statement, retval=True)
+    try:
+        statements = _captured_statements(client, {**auth_headers, "X-Correlation-ID": "trace-42"})
+    finally:
+        event.remove(db.engine, "before_cursor_execute", _comment_statement)
+    assert all(s.endswith("/*correlation_id='trace-42'*/") for s in statements)
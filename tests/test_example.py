@@ -1,5 +1,7 @@
 import pytest
 
+from app.modules.example.repository import ExampleRepository
+
 BASE = "/example"
 
 VALID_PAYLOAD = {"name": "Jane Doe", "email": "jane@example.com", "age": 25}
@@ -110,3 +112,163 @@ def test_delete_confirms_gone(client, auth_headers):
 def test_delete_not_found(client, auth_headers):
     res = client.delete(f"{BASE}/999999", headers=auth_headers)
     assert res.status_code == 404
+
+
+# --- ?fields= sparse fieldsets ---
+
+def test_list_fields_projection(client, auth_headers):
+    client.post(BASE, json={"name": "Sparse List", "email": "sparse@example.com", "age": 33}, headers=auth_headers)
+    res = client.get(f"{BASE}?fields=id,name", headers=auth_headers)
+    assert res.status_code == 200
+    assert all(set(u) == {"id", "name"} for u in res.get_json())
+
+
+def test_get_fields_projection(client, auth_headers):
+    created = client.post(BASE, json={"name": "Sparse Get", "email": "sparseget@example.com", "age": 34}, headers=auth_headers)
+    user_id = created.get_json()["id"]
+    res = client.get(f"{BASE}/{user_id}?fields=email", headers=auth_headers)
+    assert res.status_code == 200
+    assert res.get_json() == {"email": "sparseget@example.com"}
+
+
+def test_fields_rejects_unknown(client, auth_headers):
+    res = client.get(f"{BASE}?fields=id,password_hash", headers=auth_headers)
+    assert res.status_code == 400
+
+
+def test_get_fields_not_found(client, auth_headers):
+    res = client.get(f"{BASE}/999999?fields=id", headers=auth_headers)
+    assert res.status_code == 404
+
+
+# --- Filtering, sorting and counting ---
+
+def test_list_filter_age_range(client, auth_headers):
+    client.post(BASE, json={"name": "Old Timer", "email": "old@example.com", "age": 99}, headers=auth_headers)
+    res = client.get(f"{BASE}?age__gte=90", headers=auth_headers)
+    assert res.status_code == 200
+    ages = [u["age"] for u in res.get_json()]
+    assert ages and all(age >= 90 for age in ages)
+
+
+def test_list_filter_email_prefix(client, auth_headers):
+    client.post(BASE, json={"name": "Prefix One", "email": "prefix1@example.com", "age": 40}, headers=auth_headers)
+    client.post(BASE, json={"name": "Prefix Two", "email": "prefix2@example.com", "age": 41}, headers=auth_headers)
+    res = client.get(f"{BASE}?email__prefix=prefix&sort=-email", headers=auth_headers)
+    emails = [u["email"] for u in res.get_json()]
+    assert emails == ["prefix2@example.com", "prefix1@example.com"]
+
+
+def test_list_filter_email_prefix_max_code_point(client, auth_headers):
+    for prefix in ("%F4%8F%BF%BF", "jane%F4%8F%BF%BF", "%ED%9F%BF"):
+        res = client.get(f"{BASE}?email__prefix={prefix}", headers=auth_headers)
+        assert res.status_code == 200
+        assert res.get_json() == []
+
+
+def test_list_filter_created_at_range(client, auth_headers):
+    res = client.get(f"{BASE}?created_at__gte=2999-01-01T00:00:00", headers=auth_headers)
+    assert res.status_code == 200
+    assert res.get_json() == []
+
+
+def test_list_count_header(client, auth_headers):
+    client.post(BASE, json={"name": "Counted", "email": "counted@example.com", "age": 77}, headers=auth_headers)
+    res = client.get(f"{BASE}?age=77&count=true", headers=auth_headers)
+    assert res.headers["X-Total-Count"] == str(len(res.get_json())) == "1"
+
+
+def test_list_rejects_unwhitelisted_filter(client, auth_headers):
+    res = client.get(f"{BASE}?name__prefix=J", headers=auth_headers)
+    assert res.status_code == 400
+
+
+def test_list_rejects_bad_filter_value(client, auth_headers):
+    res = client.get(f"{BASE}?age__gte=old", headers=auth_headers)
+    assert res.status_code == 400
+
+
+def test_list_rejects_unwhitelisted_sort(client, auth_headers):
+    res = client.get(f"{BASE}?sort=name", headers=auth_headers)
+    assert res.status_code == 400
+
+
+# --- POST /example/bulk-delete ---
+
+def _create(client, auth_headers, name, email, age=30):
+    return client.post(BASE, json={"name": name, "email": email, "age": age}, headers=auth_headers).get_json()["id"]
+
+
+def test_bulk_delete_requires_auth(client):
+    res = client.post(f"{BASE}/bulk-delete", json={"ids": [1]})
+    assert res.status_code == 401
+
+
+def test_bulk_delete_by_ids(client, auth_headers):
+    ids = [_create(client, auth_headers, f"Bulk {i}", f"bulk{i}@example.com") for i in range(3)]
+    res = client.post(f"{BASE}/bulk-delete", json={"ids": ids + [999999]}, headers=auth_headers)
+    assert res.status_code == 200
+    assert res.get_json() == {"deleted": 3}
+    assert all(client.get(f"{BASE}/{i}", headers=auth_headers).status_code == 404 for i in ids)
+
+
+def test_bulk_delete_by_filter(client, auth_headers, app, monkeypatch):
+    monkeypatch.setitem(app.config, "BULK_DELETE_CHUNK_SIZE", 2)
+    for i in range(5):
+        _create(client, auth_headers, f"Filtered {i}", f"bulkfilter{i}@example.com", age=118)
+    res = client.post(f"{BASE}/bulk-delete", json={"filter": {"age__gte": 118}}, headers=auth_headers)
+    assert res.get_json() == {"deleted": 5}
+    assert client.get(f"{BASE}?age__gte=118", headers=auth_headers).get_json() == []
+
+
+def test_bulk_delete_requires_exactly_one_target(client, auth_headers):
+    assert client.post(f"{BASE}/bulk-delete", json={}, headers=auth_headers).status_code == 400
+    both = {"ids": [1], "filter": {"age": 30}}
+    assert client.post(f"{BASE}/bulk-delete", json=both, headers=auth_headers).status_code == 400
+
+
+def test_bulk_delete_rejects_unwhitelisted_filter(client, auth_headers):
+    res = client.post(f"{BASE}/bulk-delete", json={"filter": {"name": "x"}}, headers=auth_headers)
+    assert res.status_code == 400
+
+
+@pytest.mark.parametrize("body", [
+    {"filter": {"count": 1}},
+    {"filter": {"fields": "id"}},
+    {"filter": {"email__prefix": ""}},
+])
+def test_bulk_delete_rejects_filter_without_conditions(client, auth_headers, body):
+    before = len(client.get(BASE, headers=auth_headers).get_json())
+    res = client.post(f"{BASE}/bulk-delete", json=body, headers=auth_headers)
+    assert res.status_code == 400
+    assert len(client.get(BASE, headers=auth_headers).get_json()) == before > 0
+
+
+@pytest.mark.parametrize("condition", [
+    {"age": 29.9},
+    {"age": True},
+    {"age__gte": "18"},
+    {"email": None},
+    {"email__prefix": 1},
+])
+def test_bulk_delete_rejects_mistyped_filter_values(client, auth_headers, condition):
+    before = len(client.get(BASE, headers=auth_headers).get_json())
+    res = client.post(f"{BASE}/bulk-delete", json={"filter": condition}, headers=auth_headers)
+    assert res.status_code == 400
+    assert len(client.get(BASE, headers=auth_headers).get_json()) == before
+
+
+def test_delete_matching_refuses_empty_filters(app):
+    with pytest.raises(ValueError):
+        ExampleRepository().delete_matching([])
+
+
+def test_soft_delete_hides_then_purges(client, auth_headers, app, monkeypatch):
+    monkeypatch.setitem(app.config, "SOFT_DELETE_USERS", True)
+    user_id = _create(client, auth_headers, "Soft Delete", "soft@example.com")
+    assert client.delete(f"{BASE}/{user_id}", headers=auth_headers).status_code == 200
+    assert client.get(f"{BASE}/{user_id}", headers=auth_headers).status_code == 404
+    assert client.delete(f"{BASE}/{user_id}", headers=auth_headers).status_code == 404
+
+    result = app.test_cli_runner().invoke(args=["example", "purge-deleted", "--older-than-days", "0"])
+    assert "Purged 1 soft-deleted users" in result.output
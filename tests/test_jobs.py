@@ -0,0 +1,149 @@
+from datetime import time, timedelta
+
+import pytest
+
+from app.core.jobs import PERIODIC, TASKS, Worker, enqueue, task
+from app.database.schema import Job
+from app.extensions import db
+from app.utils.timezone import utc_now
+
+calls = []
+
+
+@task("test.record")
+def record(value):
+    calls.append(value)
+
+
+@task("test.explode")
+def explode():
+    raise RuntimeError("boom")
+
+
+@pytest.fixture()
+def worker(app):
+    db.session.execute(db.delete(Job))
+    db.session.commit()
+    calls.clear()
+    return Worker(app, concurrency=1, worker_id="test-worker")
+
+
+def test_enqueue_unknown_task_rejected(worker):
+    with pytest.raises(ValueError):
+        enqueue("test.missing")
+
+
+def test_enqueue_commits_with_the_caller(worker):
+    enqueue("test.record", {"value": 1})
+    db.session.rollback()
+    assert not worker.run_once()
+
+
+def test_cli_enqueue_unknown_task_is_a_usage_error(worker, app):
+    result = app.test_cli_runner().invoke(args=["jobs", "enqueue", "test.missing"])
+    assert result.exit_code == 2 and "Unknown task 'test.missing'" in result.output
+
+
+def test_job_runs_and_records_timing(worker):
+    job = enqueue("test.record", {"value": 42})
+    assert worker.run_once()
+    db.session.refresh(job)
+    assert calls == [42]
+    assert job.status == "done"
+    assert job.attempts == 1
+    assert job.duration_ms is not None and job.finished_at is not None
+    assert not worker.run_once()
+
+
+def test_future_job_not_claimed(worker):
+    enqueue("test.record", {"value": 1}, run_at=utc_now() + timedelta(hours=1))
+    assert not worker.run_once()
+
+
+def test_failed_job_retried_with_backoff_then_failed(worker):
+    job = enqueue("test.explode", max_attempts=2)
+    worker.run_once()
+    db.session.refresh(job)
+    assert job.status == "queued"
+    assert "RuntimeError: boom" in job.last_error
+    assert not worker.run_once()  # backing off
+
+    job.run_at = utc_now()
+    db.session.commit()
+    worker.run_once()
+    db.session.refresh(job)
+    assert job.status == "failed"
+    assert job.attempts == 2
+
+
+def test_stale_running_job_requeued(worker, app, monkeypatch):
+    monkeypatch.setitem(app.config, "JOB_LOCK_TIMEOUT", 0)
+    job = enqueue("test.record", {"value": 7})
+    job.status, job.locked_by, job.locked_at = "running", "dead-worker", utc_now() - timedelta(seconds=5)
+    db.session.commit()
+    assert worker.run_once()
+    assert calls == [7]
+
+
+def test_stale_job_with_no_attempts_left_failed(worker, app, monkeypatch):
+    monkeypatch.setitem(app.config, "JOB_LOCK_TIMEOUT", 0)
+    job = enqueue("test.record", {"value": 7}, max_attempts=2)
+    job.status, job.locked_by, job.attempts = "running", "dead-worker", 2
+    job.locked_at = utc_now() - timedelta(seconds=5)
+    db.session.commit()
+    assert not worker.run_once()
+    db.session.refresh(job)
+    assert job.status == "failed" and job.last_error == "Worker lost: lock expired"
+    assert calls == []
+
+
+def test_heartbeat_keeps_long_job_locked(worker, app, monkeypatch):
+    monkeypatch.setitem(app.config, "JOB_LOCK_TIMEOUT", 60)
+    job = enqueue("test.record", {"value": 7})
+    job.status, job.locked_by, job.locked_at = "running", "test-worker", utc_now() - timedelta(seconds=120)
+    db.session.commit()
+    assert worker.touch(job.id)
+    assert not worker.run_once()
+    db.session.refresh(job)
+    assert job.status == "running" and calls == []
+    assert not Worker(app, worker_id="other-worker").touch(job.id)
+
+
+def test_outcome_not_recorded_after_lock_lost(worker, monkeypatch):
+    def taken_over():
+        # Simulates a stale-lock requeue handing the job to another worker mid-run.
+        db.session.execute(db.update(Job).values(locked_by="other-worker"))
+        db.session.commit()
+
+    monkeypatch.setitem(TASKS, "test.taken_over", taken_over)
+    job = enqueue("test.taken_over")
+    assert worker.run_once()
+    db.session.refresh(job)
+    assert job.status == "running" and job.locked_by == "other-worker" and job.finished_at is None
+
+
+def test_stale_scan_throttled_to_heartbeat_interval(worker, app, monkeypatch):
+    monkeypatch.setitem(app.config, "JOB_LOCK_TIMEOUT", 0)
+    assert not worker.run_once()
+    job = enqueue("test.record", {"value": 7})
+    job.status, job.locked_by, job.locked_at = "running", "dead-worker", utc_now() - timedelta(seconds=5)
+    db.session.commit()
+    assert not worker.run_once()
+    worker._next_requeue = 0.0
+    assert worker.run_once() and calls == [7]
+
+
+def test_periodic_enqueued_once_per_day(worker, app, monkeypatch):
+    monkeypatch.setitem(PERIODIC, "test.daily", (time(0, 0), "UTC"))
+    monkeypatch.setitem(TASKS, "test.daily", lambda: calls.append("daily"))
+    other = Worker(app, concurrency=1, worker_id="other-worker")
+    for w in (worker, other, worker):
+        w.schedule_periodic()
+    assert db.session.scalar(db.select(db.func.count()).select_from(Job).filter_by(name="test.daily")) == 1
+
+
+def test_jobs_stats_cli(worker, app):
+    enqueue("test.record", {"value": 1})
+    worker.run_once()
+    result = app.test_cli_runner().invoke(args=["jobs", "stats"])
+    assert "test.record" in result.output and "done" in result.output
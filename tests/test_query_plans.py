@@ -0,0 +1,108 @@
+"""Query-plan regression tests.
+
+Every statement a repository issues is captured and run through SQLite's
+EXPLAIN QUERY PLAN. A `SCAN <table>` step that isn't backed by an index
+means a full table scan and fails the test, unless the query is an
+unfiltered listing where scanning the driving table is the whole point.
+"""
+import re
+from datetime import datetime, timezone
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from app.extensions import db
+from app.database.schema import Permission, Role, User
+from app.modules.example.repository import ExampleRepository
+
+FULL_SCAN = re.compile(r"^SCAN (\w+)$")
+
+
+@contextmanager
+def capture_selects():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    engine = db.engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def explain(statement, parameters):
+    conn = db.session.connection().connection.driver_connection
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+
+
+@pytest.fixture()
+def repo(app, auth_headers):
+    db.session.expunge_all()
+    return ExampleRepository()
+
+
+def assert_no_full_scans(statements, allowed=()):
+    assert statements, "expected the repository to issue at least one SELECT"
+    for statement, parameters in statements:
+        plan = explain(statement, parameters)
+        scanned = [m.group(1) for m in (FULL_SCAN.match(step) for step in plan) if m]
+        unexpected = [t for t in scanned if t not in allowed]
+        assert not unexpected, f"full table scan on {unexpected}:\n{statement}\n" + "\n".join(plan)
+
+
+def test_get_all_only_scans_users(repo):
+    with capture_selects() as statements:
+        repo.get_all()
+    assert_no_full_scans(statements, allowed=("users",))
+
+
+def test_get_by_id_uses_primary_key(repo):
+    with capture_selects() as statements:
+        repo.get_by_id(1)
+    assert_no_full_scans(statements)
+
+
+def test_permission_lookup_uses_index(repo):
+    with capture_selects() as statements:
+        db.session.execute(
+            db.select(Role.id).join(Role.permissions).where(Permission.name == "example.delete")
+        ).all()
+    assert_no_full_scans(statements)
+
+
+def test_users_by_role_uses_index(repo):
+    with capture_selects() as statements:
+        db.session.execute(db.select(User.id).where(User.role_id == 1)).all()
+    assert_no_full_scans(statements)
+
+
+def test_recent_users_uses_created_at_index(repo):
+    with capture_selects() as statements:
+        db.session.execute(db.select(User.id).order_by(User.created_at.desc()).limit(10)).all()
+    assert_no_full_scans(statements)
+
+
+def test_projected_get_all_reads_only_requested_columns(repo):
+    with capture_selects() as statements:
+        repo.get_all(fields=("id", "name"))
+    assert_no_full_scans(statements, allowed=("users",))
+    assert len(statements) == 1
+    assert "password_hash" not in statements[0][0] and "JOIN" not in statements[0][0]
+
+
+@pytest.mark.parametrize("filters, sort", [
+    ([("age", "gte", 18)], ()),
+    ([("email", "prefix", "jane")], ()),
+    ([("created_at", "gte", datetime(2026, 1, 1, tzinfo=timezone.utc))], ()),
+    ([], [("created_at", True)]),
+    ([], [("age", False)]),
+])
+def test_filtered_listing_uses_indexes(repo, filters, sort):
+    with capture_selects() as statements:
+        repo.get_all(fields=("id", "name"), filters=filters, sort=sort)
+    assert_no_full_scans(statements)
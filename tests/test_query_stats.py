@@ -0,0 +1,61 @@
+import json
+import logging
+import time
+from types import SimpleNamespace
+
+from flask import g
+
+from app.core.logging import JSONFormatter
+from app.core.query_stats import QueryStats, _record_query, _start_timer, fingerprint, query_stats
+
+
+def test_fingerprint_normalizes_values():
+    a = fingerprint("SELECT * FROM users WHERE id IN (?, ?, ?) AND email = 'a@x.io' LIMIT 10 /*correlation_id='x'*/")
+    b = fingerprint("SELECT *  FROM users\nWHERE id IN (?) AND email = 'b@y.io' LIMIT 20")
+    assert a == b == "SELECT * FROM users WHERE id IN (...) AND email = ? LIMIT ?"
+    assert fingerprint("SELECT anon_1.id FROM t WHERE x = %(x_1)s") == "SELECT anon_1.id FROM t WHERE x = ?"
+    assert fingerprint("SELECT reltuples::bigint FROM pg_class WHERE relname = :table") == (
+        "SELECT reltuples::bigint FROM pg_class WHERE relname = ?"
+    )
+
+
+def test_stats_are_bounded_and_aggregated():
+    stats = QueryStats(max_fingerprints=2, sample_size=100)
+    stats.record("SELECT 1 FROM b", 0.001)
+    for ms in range(1, 101):
+        stats.record("SELECT 1 FROM a WHERE x = ?", ms / 1000)
+    stats.record("SELECT 1 FROM c", 0.001)  # evicts b, the least recently seen
+    report = stats.top(sort="count")
+    assert [row["fingerprint"] for row in report] == ["SELECT ? FROM a WHERE x = ?", "SELECT ? FROM c"]
+    assert report[0]["count"] == 100 and report[0]["max_ms"] == 100 and report[0]["p95_ms"] == 95
+
+
+def test_slow_query_logged_with_correlation_id(app, caplog):
+    stats = QueryStats(slow_threshold_ms=0)
+    with app.test_request_context(), caplog.at_level(logging.WARNING, logger="app.core.query_stats"):
+        g.correlation_id = "trace-7"
+        stats.record("SELECT * FROM users WHERE id = ?", 0.25)
+        line = json.loads(JSONFormatter().format(caplog.records[-1]))
+    assert line["correlation_id"] == "trace-7"
+    assert line["message"] == "Slow query (250.0ms): SELECT * FROM users WHERE id = ?"
+
+
+def test_endpoint_reports_request_queries(client, auth_headers):
+    query_stats.reset()
+    client.get("/example", headers=auth_headers)
+    res = client.get("/query-stats?sort=count&limit=5", headers=auth_headers)
+    assert res.status_code == 200
+    assert any("FROM users" in row["fingerprint"] for row in res.get_json()["queries"])
+    assert client.get("/query-stats?sort=bogus", headers=auth_headers).status_code == 400
+    assert client.get("/query-stats").status_code == 401
+
+
+def test_per_statement_overhead(app):
+    context = SimpleNamespace(statement="SELECT users.id, users.name FROM users WHERE users.id = ? LIMIT ? OFFSET ?")
+    runs = 20000
+    started = time.perf_counter()
+    for _ in range(runs):
+        _start_timer(None, None, context.statement, (), context, False)
+        _record_query(None, None, context.statement, (), context, False)
+    per_statement_us = (time.perf_counter() - started) / runs * 1_000_000
+    assert per_statement_us < 50, f"query stats overhead: {per_statement_us:.2f} us/statement"
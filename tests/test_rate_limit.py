@@ -0,0 +1,113 @@
+import pytest
+
+from app.database.schema import Role
+from app.extensions import db, limiter
+from app.utils.rate_limit import rate_limit_key
+
+BASE = "/example"
+
+
+@pytest.fixture()
+def limited(app, monkeypatch):
+    monkeypatch.setattr(limiter, "enabled", True)
+    monkeypatch.setitem(app.config, "RATELIMIT_ROLE_CACHE_TTL", 0)
+    limiter.reset()
+    yield
+    limiter.reset()
+    admin = db.session.execute(db.select(Role).filter_by(name="admin")).scalar_one()
+    admin.rate_limit_multiplier = 1.0
+    db.session.commit()
+
+
+def test_key_uses_jwt_identity(app, auth_headers):
+    with app.test_request_context(headers=auth_headers):
+        assert rate_limit_key().startswith("user:")
+
+
+def test_key_falls_back_to_ip(app):
+    with app.test_request_context(environ_base={"REMOTE_ADDR": "203.0.113.7"}):
+        assert rate_limit_key() == "ip:203.0.113.7"
+
+
+def test_key_ignores_invalid_token(app):
+    headers = {"Authorization": "Bearer not-a-token"}
+    with app.test_request_context(headers=headers, environ_base={"REMOTE_ADDR": "203.0.113.8"}):
+        assert rate_limit_key() == "ip:203.0.113.8"
+
+
+def test_token_carries_role_claim(client, auth_headers, app):
+    from flask_jwt_extended import decode_token
+
+    with app.app_context():
+        assert decode_token(auth_headers["Authorization"].split()[1])["role"] == "admin"
+
+
+def test_bulk_cost_counts_items(client, auth_headers, limited, app, monkeypatch):
+    monkeypatch.setitem(app.config, "BULK_DELETE_MAX_IDS", 1000)
+    ids = list(range(900_000, 900_600))
+    assert client.post(f"{BASE}/bulk-delete", json={"ids": ids}, headers=auth_headers).status_code == 200
+    assert client.post(f"{BASE}/bulk-delete", json={"ids": ids}, headers=auth_headers).status_code == 429
+
+
+def test_role_multiplier_raises_limit(client, auth_headers, limited, app, monkeypatch):
+    monkeypatch.setitem(app.config, "BULK_DELETE_MAX_IDS", 1000)
+    admin = db.session.execute(db.select(Role).filter_by(name="admin")).scalar_one()
+    admin.rate_limit_multiplier = 2.0
+    db.session.commit()
+    ids = list(range(900_000, 900_600))
+    for _ in range(3):
+        assert client.post(f"{BASE}/bulk-delete", json={"ids": ids}, headers=auth_headers).status_code == 200
+    assert client.post(f"{BASE}/bulk-delete", json={"ids": ids}, headers=auth_headers).status_code == 429
+
+
+def test_max_size_bulk_request_fits_the_limit(client, auth_headers, limited, app, monkeypatch):
+    monkeypatch.setitem(app.config, "BULK_DELETE_MAX_IDS", 1500)
+    ids = list(range(900_000, 901_500))
+    assert client.post(f"{BASE}/bulk-delete", json={"ids": ids}, headers=auth_headers).status_code == 200
+    assert client.post(f"{BASE}/bulk-delete", json={"ids": [1]}, headers=auth_headers).status_code == 429
+
+
+def test_filter_delete_charges_declared_max_rows(client, auth_headers, limited, app, monkeypatch):
+    monkeypatch.setitem(app.config, "BULK_DELETE_MAX_IDS", 5)
+    for i in range(4):
+        payload = {"name": f"Charged {i}", "email": f"charged{i}@example.com", "age": 117}
+        assert client.post(BASE, json=payload, headers=auth_headers).status_code == 201
+    res = client.post(f"{BASE}/bulk-delete", json={"filter": {"age": 117}, "max_rows": 3}, headers=auth_headers)
+    assert res.get_json() == {"deleted": 3}
+    # Charged for the declared cap, not the one row left to delete.
+    res = client.post(f"{BASE}/bulk-delete", json={"filter": {"age": 117}, "max_rows": 2}, headers=auth_headers)
+    assert res.get_json() == {"deleted": 1}
+    assert client.post(f"{BASE}/bulk-delete", json={"ids": [900_000]}, headers=auth_headers).status_code == 429
+
+
+def test_filter_delete_without_max_rows_needs_full_budget(client, auth_headers, limited, app, monkeypatch):
+    monkeypatch.setitem(app.config, "BULK_DELETE_MAX_IDS", 5)
+    assert client.post(f"{BASE}/bulk-delete", json={"ids": [900_000]}, headers=auth_headers).status_code == 200
+    res = client.post(f"{BASE}/bulk-delete", json={"filter": {"age": 117}}, headers=auth_headers)
+    assert res.status_code == 429
+
+
+@pytest.mark.parametrize("body", [
+    {"filter": {"age": 117}, "max_rows": 6},
+    {"filter": {"age": 117}, "max_rows": 0},
+    {"filter": {"age": 117}, "max_rows": True},
+    {"ids": [1], "max_rows": 1},
+])
+def test_bulk_delete_rejects_invalid_max_rows(client, auth_headers, app, monkeypatch, body):
+    monkeypatch.setitem(app.config, "BULK_DELETE_MAX_IDS", 5)
+    assert client.post(f"{BASE}/bulk-delete", json=body, headers=auth_headers).status_code == 400
+
+
+def test_users_do_not_share_a_bucket(client, auth_headers, limited, app):
+    from flask_jwt_extended import create_access_token
+    from app.database.schema import User
+
+    other = User(name="Other Tenant", email="tenant@example.com")
+    db.session.add(other)
+    db.session.commit()
+    with app.app_context():
+        other_headers = {"Authorization": f"Bearer {create_access_token(identity=str(other.id))}"}
+    for _ in range(30):
+        client.get(BASE, headers=auth_headers)
+    assert client.get(BASE, headers=auth_headers).status_code == 429
+    assert client.get(BASE, headers=other_headers).status_code == 200
@@ -0,0 +1,33 @@
+import pytest
+
+from app.extensions import db
+from app.modules.example.model import ExampleRead
+from app.modules.example.repository import ExampleRepository
+from app.utils.read_model import ReadModel, read_model
+
+
+def test_read_model_is_slotted_and_cached():
+    UserRow = read_model("UserRow", ("id", "name"))
+    row = UserRow(1, "Jane")
+    assert read_model("UserRow", ("id", "name")) is UserRow
+    assert not hasattr(row, "__dict__")
+    assert (row.id, row.name) == (1, "Jane") == tuple(row)
+    assert row._asdict() == {"id": 1, "name": "Jane"}
+    assert row == UserRow(1, "Jane")
+    with pytest.raises(AttributeError):
+        row.email = "jane@example.com"
+
+
+def test_repository_returns_untracked_read_models(app, auth_headers):
+    db.session.expunge_all()
+    users = ExampleRepository().get_all()
+    assert users and all(isinstance(user, ReadModel) for user in users)
+    assert len(db.session.identity_map) == 0
+    assert ExampleRead().dump(users, many=True)[0].keys() == {"id", "name", "email", "age"}
+
+
+def test_get_by_id_returns_requested_fields(app, auth_headers):
+    user_id = ExampleRepository().get_all(fields=("id",))[0].id
+    user = ExampleRepository().get_by_id(user_id, fields=("id", "email"))
+    assert user._fields == ("id", "email")
+    assert ExampleRepository().get_by_id(10 ** 9) is None
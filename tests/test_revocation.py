@@ -0,0 +1,113 @@
+import time
+import uuid
+
+import pytest
+from flask_jwt_extended import create_access_token, decode_token
+from sqlalchemy import event
+
+from app.core.revocation import BloomFilter, RevocationIndex, RevocationStore, _from_epoch, revoke_token
+from app.database.schema import RevokedToken, User
+from app.extensions import db
+
+
+def payload(exp_in=900, now=None):
+    return {"jti": str(uuid.uuid4()), "type": "access", "exp": int((now or time.time()) + exp_in)}
+
+
+@pytest.fixture()
+def store_config(app):
+    return dict(app.config, JWT_REVOCATION_SYNC_INTERVAL=0)
+
+
+# --- BloomFilter / RevocationIndex ---
+
+def test_bloom_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    items = [str(uuid.uuid4()) for _ in range(1000)]
+    for item in items:
+        bloom.add(item)
+    assert all(item in bloom for item in items)
+
+
+def test_bloom_false_positive_rate_near_target():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for _ in range(1000):
+        bloom.add(str(uuid.uuid4()))
+    false_positives = sum(str(uuid.uuid4()) in bloom for _ in range(10000))
+    assert false_positives < 300
+
+
+def test_index_drops_expired_buckets():
+    index = RevocationIndex(bucket_seconds=60, capacity=100, error_rate=0.01)
+    index.add("old", 1000)
+    index.add("new", 5000)
+    index.prune(2000)
+    assert not index.might_contain("old", 1000)
+    assert index.might_contain("new", 5000)
+    assert len(index) == 1
+
+
+# --- RevocationStore ---
+
+def test_revoked_token_rejected(client, auth_headers, app):
+    with app.app_context():
+        user = db.session.execute(db.select(User).filter_by(email="test@example.com")).scalar_one()
+        token = create_access_token(identity=str(user.id))
+        headers = {"Authorization": f"Bearer {token}"}
+        assert client.get("/example", headers=headers).status_code == 200
+        revoke_token(decode_token(token))
+    assert client.get("/example", headers=headers).status_code == 401
+    assert client.get("/example", headers=auth_headers).status_code == 200
+
+
+def test_revocation_visible_to_other_workers(app, store_config):
+    worker_a = RevocationStore(store_config)
+    worker_b = RevocationStore(store_config)
+    token = payload()
+    assert not worker_b.is_revoked(token)
+    worker_a.revoke(token)
+    assert worker_b.is_revoked(token)
+
+
+def test_late_commit_with_lower_id_is_synced(app, store_config):
+    worker = RevocationStore(store_config)
+    now = time.time()
+    first, late = payload(), payload()
+    db.session.add(RevokedToken(
+        id=1_000_000, jti=first["jti"], token_type="access", expires_at=_from_epoch(first["exp"]),
+    ))
+    db.session.commit()
+    assert worker.is_revoked(first)
+    # Took its id (and revoked_at) before `first`, committed after the sync above.
+    db.session.add(RevokedToken(
+        id=999_999, jti=late["jti"], token_type="access",
+        expires_at=_from_epoch(late["exp"]), revoked_at=_from_epoch(now - 10),
+    ))
+    db.session.commit()
+    assert worker.is_revoked(late)
+
+
+def test_bloom_miss_skips_database(app, store_config):
+    store = RevocationStore(dict(store_config, JWT_REVOCATION_SYNC_INTERVAL=3600))
+    store.is_revoked(payload())  # first call syncs
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", count)
+    try:
+        assert not store.is_revoked(payload())
+    finally:
+        event.remove(db.engine, "before_cursor_execute", count)
+    assert statements == []
+
+
+def test_expired_revocations_pruned(app, store_config, clock):
+    store = RevocationStore(dict(store_config, JWT_REVOCATION_PRUNE_INTERVAL=60), clock=clock)
+    token = payload(exp_in=30, now=clock.now)
+    store.revoke(token)
+    clock.now += 3600 * 2 + 61
+    store.is_revoked(payload(now=clock.now))
+    assert db.session.scalar(db.select(RevokedToken).filter_by(jti=token["jti"])) is None
+    assert len(store.index) == 0
@@ -0,0 +1,103 @@
+import pytest
+from flask import Flask, jsonify
+from flask_jwt_extended import create_access_token, decode_token, jwt_required
+
+from app.core.config import TestingConfig
+from app.core.tokens import CachingJWTManager, TokenCache
+
+
+# --- TokenCache ---
+
+def test_cache_entry_expires_at_exp(clock):
+    cache = TokenCache(maxsize=10, max_ttl=900, clock=clock)
+    cache.put(b"k", {"sub": "1", "exp": clock.now + 60})
+    assert cache.get(b"k") == {"sub": "1", "exp": clock.now + 60}
+    clock.now += 60
+    assert cache.get(b"k") is None
+    assert len(cache) == 0
+
+
+def test_cache_entry_capped_by_max_ttl(clock):
+    cache = TokenCache(maxsize=10, max_ttl=30, clock=clock)
+    cache.put(b"k", {"sub": "1", "exp": clock.now + 3600})
+    clock.now += 31
+    assert cache.get(b"k") is None
+
+
+def test_cache_skips_already_expired_claims(clock):
+    cache = TokenCache(maxsize=10, max_ttl=900, clock=clock)
+    cache.put(b"k", {"sub": "1", "exp": clock.now - 1})
+    assert len(cache) == 0
+
+
+def test_cache_is_bounded():
+    cache = TokenCache(maxsize=2, max_ttl=900)
+    for key in (b"a", b"b", b"c"):
+        cache.put(key, {"sub": key.decode()})
+    assert len(cache) == 2
+    assert cache.get(b"a") is None
+
+
+def test_cache_key_depends_on_csrf_value():
+    assert TokenCache.key("token") != TokenCache.key("token", "csrf")
+
+
+# --- CachingJWTManager ---
+
+@pytest.fixture()
+def jwt_app():
+    app = Flask(__name__)
+    app.config.from_object(TestingConfig)
+    app.config["JWT_SECRET_KEY"] = "test-secret-key-that-is-long-enough"
+    manager = CachingJWTManager(app)
+    revoked = set()
+
+    @manager.token_in_blocklist_loader
+    def is_revoked(jwt_header, jwt_payload):
+        return jwt_payload["jti"] in revoked
+
+    @app.route("/protected")
+    @jwt_required()
+    def protected():
+        return jsonify({"ok": True})
+
+    app.revoked = revoked
+    return app
+
+
+def test_decode_is_cached(jwt_app):
+    with jwt_app.app_context():
+        token = create_access_token(identity="1")
+        first = decode_token(token)
+        cache = jwt_app.extensions["jwt_decode_cache"]
+        assert len(cache) == 1
+        first["sub"] = "tampered"
+        assert decode_token(token)["sub"] == "1"
+
+
+def test_revocation_still_honored_for_cached_token(jwt_app):
+    client = jwt_app.test_client()
+    with jwt_app.app_context():
+        token = create_access_token(identity="1")
+        jti = decode_token(token)["jti"]
+    headers = {"Authorization": f"Bearer {token}"}
+    assert client.get("/protected", headers=headers).status_code == 200
+    jwt_app.revoked.add(jti)
+    assert client.get("/protected", headers=headers).status_code == 401
+
+
+def test_tampered_token_not_served_from_cache(jwt_app):
+    client = jwt_app.test_client()
+    with jwt_app.app_context():
+        token = create_access_token(identity="1")
+    assert client.get("/protected", headers={"Authorization": f"Bearer {token}"}).status_code == 200
+    res = client.get("/protected", headers={"Authorization": f"Bearer {token[:-2]}xx"})
+    assert res.status_code == 422
+
+
+def test_cache_disabled_when_size_zero():
+    app = Flask(__name__)
+    app.config.from_object(TestingConfig)
+    app.config["JWT_DECODE_CACHE_SIZE"] = 0
+    CachingJWTManager(app)
+    assert app.extensions["jwt_decode_cache"] is None
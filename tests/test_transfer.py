@@ -0,0 +1,149 @@
+import csv
+import io
+import json
+
+import pytest
+
+from app.database.schema import User
+from app.extensions import db
+
+BASE = "/example"
+
+
+def _ndjson(*records):
+    return "".join(json.dumps(r) + "\n" for r in records)
+
+
+# --- GET /example/export ---
+
+def test_export_requires_auth(client):
+    assert client.get(f"{BASE}/export").status_code == 401
+
+
+def test_export_ndjson(client, auth_headers):
+    client.post(BASE, json={"name": "Export Me", "email": "export@example.com", "age": 44}, headers=auth_headers)
+    res = client.get(f"{BASE}/export?format=ndjson", headers=auth_headers)
+    assert res.status_code == 200
+    assert res.mimetype == "application/x-ndjson"
+    rows = [json.loads(line) for line in res.get_data(as_text=True).splitlines()]
+    assert {"name": "Export Me", "email": "export@example.com", "age": 44}.items() <= next(
+        r for r in rows if r["email"] == "export@example.com"
+    ).items()
+    assert all("password_hash" not in r for r in rows)
+
+
+def test_export_csv(client, auth_headers):
+    res = client.get(f"{BASE}/export?format=csv", headers=auth_headers)
+    rows = list(csv.DictReader(io.StringIO(res.get_data(as_text=True))))
+    assert res.mimetype == "text/csv"
+    assert rows and set(rows[0]) == {"id", "name", "email", "age"}
+
+
+def test_export_rejects_unknown_format(client, auth_headers):
+    assert client.get(f"{BASE}/export?format=xml", headers=auth_headers).status_code == 400
+
+
+# --- POST /example/import ---
+
+def test_import_ndjson_reports_failures(client, auth_headers):
+    body = _ndjson(
+        {"name": "Imported One", "email": "imported1@example.com", "age": 20},
+        {"name": "Too Young", "email": "young@example.com", "age": 3},
+        {"name": "Imported Dup", "email": "imported1@example.com", "age": 21},
+    ) + "not json\n"
+    res = client.post(f"{BASE}/import", data=body, content_type="application/x-ndjson", headers=auth_headers)
+    summary = res.get_json()
+    assert res.status_code == 200
+    assert summary["processed"] == 4
+    assert summary["imported"] == 1
+    assert summary["failed"] == 3
+    assert [e["line"] for e in summary["errors"]] == [2, 4, 3]
+
+
+def test_import_csv_resumes_from_start(client, auth_headers):
+    body = "name,email,age\nSkipped Row,skipped@example.com,30\nResumed Row,resumed@example.com,31\n"
+    res = client.post(f"{BASE}/import?start=1", data=body, content_type="text/csv", headers=auth_headers)
+    assert res.get_json()["imported"] == 1
+    emails = [u["email"] for u in client.get(BASE, headers=auth_headers).get_json()]
+    assert "resumed@example.com" in emails and "skipped@example.com" not in emails
+
+
+@pytest.mark.parametrize("fmt, content_type", [("csv", "text/csv"), ("ndjson", "application/x-ndjson")])
+def test_export_import_round_trip(client, auth_headers, fmt, content_type):
+    users = [
+        User(name="Round Trip Aged", email=f"roundtrip-aged-{fmt}@example.com", age=33),
+        User(name="Round Trip Ageless", email=f"roundtrip-ageless-{fmt}@example.com"),
+    ]
+    db.session.add_all(users)
+    db.session.commit()
+    lines = client.get(f"{BASE}/export?format={fmt}", headers=auth_headers).get_data(as_text=True).splitlines()
+    kept = [line for line in lines if "roundtrip-" in line and f"-{fmt}@" in line]
+    body = "\n".join(([lines[0]] if fmt == "csv" else []) + kept) + "\n"
+    for user in users:
+        db.session.delete(user)
+    db.session.commit()
+
+    res = client.post(f"{BASE}/import", data=body, content_type=content_type, headers=auth_headers)
+    assert res.get_json() == {"processed": 2, "imported": 2, "failed": 0, "errors": []}
+    restored = db.session.execute(
+        db.select(User.email, User.age).where(User.email.like(f"roundtrip-%-{fmt}@example.com"))
+    ).all()
+    assert sorted(restored) == [(f"roundtrip-aged-{fmt}@example.com", 33), (f"roundtrip-ageless-{fmt}@example.com", None)]
+
+
+def test_import_csv_with_bom(client, auth_headers):
+    body = "\ufeffname,email,age\nBom Row,bom@example.com,40\n".encode("utf-8")
+    res = client.post(f"{BASE}/import", data=body, content_type="text/csv", headers=auth_headers)
+    assert res.get_json()["imported"] == 1
+
+
+def test_import_rejects_invalid_utf8(client, auth_headers):
+    body = b'{"name": "Bad Bytes", "email": "bad\xff@example.com", "age": 30}\n'
+    res = client.post(f"{BASE}/import", data=body, content_type="application/x-ndjson", headers=auth_headers)
+    assert res.status_code == 400
+    assert res.get_json()["error"]["processed"] == 0
+
+
+def test_import_database_error_reports_checkpoint(client, auth_headers, app, monkeypatch):
+    from sqlalchemy.exc import OperationalError
+    from app.modules.example.repository import ExampleRepository
+
+    monkeypatch.setitem(app.config, "IMPORT_BATCH_SIZE", 2)
+    original = ExampleRepository.insert_many
+    inserted = []
+
+    def fail_second_batch(self, records):
+        if inserted:
+            raise OperationalError("INSERT", {}, Exception("disk full"))
+        inserted.append(records)
+        original(self, records)
+
+    monkeypatch.setattr(ExampleRepository, "insert_many", fail_second_batch)
+    body = _ndjson(*[{"name": f"Checkpoint {i}", "email": f"checkpoint{i}@example.com", "age": 30} for i in range(4)])
+    res = client.post(f"{BASE}/import", data=body, content_type="application/x-ndjson", headers=auth_headers)
+    assert res.status_code == 500
+    assert res.get_json()["error"]["processed"] == 2
+
+
+# --- flask example export / import ---
+
+def test_cli_import_resumes_from_checkpoint(app, tmp_path, monkeypatch):
+    monkeypatch.setitem(app.config, "IMPORT_BATCH_SIZE", 2)
+    source = tmp_path / "users.ndjson"
+    source.write_text(_ndjson(*[
+        {"name": f"Cli User {i}", "email": f"cli{i}@example.com", "age": 30} for i in range(5)
+    ]))
+    (tmp_path / "users.ndjson.checkpoint").write_text(json.dumps({"processed": 2}))
+
+    result = app.test_cli_runner().invoke(args=["example", "import", str(source)])
+    assert "Imported 3 users, 0 failed" in result.stdout
+    assert "Resuming after record 2" in result.stderr
+    assert not (tmp_path / "users.ndjson.checkpoint").exists()
+
+
+def test_cli_export_to_file(app, tmp_path):
+    output = tmp_path / "users.csv"
+    result = app.test_cli_runner().invoke(args=["example", "export", "--format", "csv", "--output", str(output)])
+    assert result.exit_code == 0
+    rows = list(csv.DictReader(output.open()))
+    assert any(r["email"] == "test@example.com" for r in rows)